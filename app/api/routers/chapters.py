@@ -1,6 +1,7 @@
 import anyio
 import logging
 import os
+import re
 from pathlib import Path
 from typing import Optional, List
 from fastapi import APIRouter, Form, File, UploadFile, Request, Depends
@@ -26,6 +27,8 @@ XTTS_OUT_DIR = config.XTTS_OUT_DIR
 
 logger = logging.getLogger(__name__)
 
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7F]+")
+
 
 def get_chapter_dir() -> Path:
     return CHAPTER_DIR
@@ -283,7 +286,6 @@ def api_preview(
     chapter_dir: Path = Depends(get_chapter_dir)
 ):
     from ..utils import read_preview
-    import re
 
     try:
         safe_filename = os.path.basename(chapter_file)
@@ -309,7 +311,7 @@ def api_preview(
             text = sanitize_for_xtts(text)
             text = safe_split_long_sentences(text)
         else:
-            text = re.sub(r"[^\x00-\x7F]+", "", text)
+            text = _NON_ASCII_RE.sub("", text)
             text = text.strip()
         text = pack_text_to_limit(text, pad=True)
 
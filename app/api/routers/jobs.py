@@ -1,5 +1,5 @@
 import time
-from pathlib import Path
+import os
 from typing import Optional
 from fastapi import APIRouter, Form
 from fastapi.responses import JSONResponse
@@ -34,20 +34,24 @@ def api_jobs():
 
     # Auto-discovery
     chapters = [p.name for p in legacy_list_chapters()]
+    out_names = set()
+    if XTTS_OUT_DIR.exists():
+        with os.scandir(XTTS_OUT_DIR) as it:
+            out_names = {e.name for e in it}
     for c in chapters:
         existing = jobs_dict.get(c)
         if existing and existing['status'] == 'done' and (existing.get('output_mp3') or existing.get('output_wav')):
             continue
 
-        stem = Path(c).stem
-        x_mp3 = (XTTS_OUT_DIR / f"{stem}.mp3")
-        x_wav = (XTTS_OUT_DIR / f"{stem}.wav")
+        stem = os.path.splitext(c)[0]
+        x_mp3 = f"{stem}.mp3"
+        x_wav = f"{stem}.wav"
 
         found_job = {}
-        if x_mp3.exists():
-            found_job.update({"status": "done", "engine": "xtts", "output_mp3": x_mp3.name})
-        if x_wav.exists():
-            found_job.update({"engine": "xtts", "output_wav": x_wav.name})
+        if x_mp3 in out_names:
+            found_job.update({"status": "done", "engine": "xtts", "output_mp3": x_mp3})
+        if x_wav in out_names:
+            found_job.update({"engine": "xtts", "output_wav": x_wav})
             if not found_job.get("status"):
                 found_job["status"] = "done"
 
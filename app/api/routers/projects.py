@@ -3,6 +3,7 @@ import os
 import time
 import json
 import re
+import anyio
 from pathlib import Path
 from typing import Optional, List
 from fastapi import APIRouter, Form, File, UploadFile, Request, Query
@@ -14,12 +15,15 @@ from ...db import (
 from ...config import COVER_DIR, PROJECTS_DIR, XTTS_OUT_DIR, get_project_m4b_dir
 import urllib.parse
 from ...jobs import enqueue
-from ...engines import get_audio_duration
+from ...engines import get_audio_durations
 from ...state import put_job, update_job, get_jobs
 from ...models import Job
+from ..utils import save_upload
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
+_FIRST_NUMBER_RE = re.compile(r'(\d+)')
+
 @router.get("")
 def api_list_projects():
     return JSONResponse(list_projects())
@@ -53,8 +57,7 @@ async def api_create_project(
         ext = Path(cover.filename).suffix
         cover_filename = f"{uuid.uuid4().hex}{ext}"
         cover_p = COVER_DIR / cover_filename
-        content = await cover.read()
-        cover_p.write_bytes(content)
+        await anyio.to_thread.run_sync(save_upload, cover, cover_p)
         cover_path = f"/out/covers/{cover_filename}"
 
     pid = create_project(name, series, author, cover_path)
@@ -82,8 +85,7 @@ async def api_update_project(
         ext = Path(cover.filename).suffix
         cover_filename = f"{uuid.uuid4().hex}{ext}"
         cover_p = COVER_DIR / cover_filename
-        content = await cover.read()
-        cover_p.write_bytes(content)
+        await anyio.to_thread.run_sync(save_upload, cover, cover_p)
         updates["cover_image_path"] = f"/out/covers/{cover_filename}"
 
     if updates:
@@ -119,12 +121,12 @@ def api_list_project_audiobooks(project_id: str):
             unique_files.append((p, url))
 
     res = []
-    unique_files.sort(key=lambda x: x[0].stat().st_mtime, reverse=True)
+    unique_files = [(p, url, p.stat()) for p, url in unique_files]
+    unique_files.sort(key=lambda x: x[2].st_mtime, reverse=True)
 
-    import subprocess
-    import shlex
-    for p, url in unique_files:
-        st = p.stat()
+    from ..utils import _probe_audiobooks
+    probes = _probe_audiobooks([(p, st) for p, _, st in unique_files])
+    for (p, url, st), info in zip(unique_files, probes):
         item = {
             "filename": p.name, 
             "title": p.name, 
@@ -133,17 +135,8 @@ def api_list_project_audiobooks(project_id: str):
             "created_at": st.st_mtime,
             "size_bytes": st.st_size
         }
-        try:
-            probe_cmd = f"ffprobe -v error -show_entries format=duration:format_tags=title -of json {shlex.quote(str(p))}"
-            probe_res = subprocess.run(shlex.split(probe_cmd), capture_output=True, text=True, check=True, timeout=3)
-            probe_data = json.loads(probe_res.stdout)
-            if "format" in probe_data:
-                fmt = probe_data["format"]
-                if "duration" in fmt:
-                    item["duration_seconds"] = float(fmt["duration"])
-                if "tags" in fmt and "title" in fmt["tags"]:
-                    item["title"] = fmt["tags"]["title"]
-        except: pass
+        # Shares list_audiobooks' per-file probe cache
+        item.update(info)
 
         # Look for cover image with multiple extensions
         item["cover_url"] = None
@@ -235,16 +228,18 @@ def prepare_audiobook():
     if not src_dir.exists():
         return JSONResponse({"title": "", "chapters": []})
 
-    all_files = [f for f in os.listdir(src_dir) if f.endswith(('.wav', '.mp3'))]
     chapters_found = {}
-    for f in all_files:
-        stem = Path(f).stem
-        ext = Path(f).suffix.lower()
-        if stem not in chapters_found or ext == '.mp3':
-             chapters_found[stem] = f
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            f = entry.name
+            if not f.endswith(('.wav', '.mp3')):
+                continue
+            stem = f[:-4]
+            if stem not in chapters_found or f.endswith('.mp3'):
+                chapters_found[stem] = f
 
     def extract_number(filename):
-        match = re.search(r'(\d+)', filename)
+        match = _FIRST_NUMBER_RE.search(filename)
         return int(match.group(1)) if match else 0
 
     sorted_stems = sorted(chapters_found.keys(), key=lambda x: extract_number(x))
@@ -253,9 +248,9 @@ def prepare_audiobook():
     existing_jobs = get_jobs()
     job_titles = {j.chapter_file: j.custom_title for j in existing_jobs.values() if j.custom_title}
 
-    for stem in sorted_stems:
+    durations = get_audio_durations([src_dir / chapters_found[stem] for stem in sorted_stems])
+    for stem, dur in zip(sorted_stems, durations):
         fname = chapters_found[stem]
-        dur = get_audio_duration(src_dir / fname)
         display_name = job_titles.get(stem + ".txt") or job_titles.get(stem) or stem
         preview.append({
             "filename": fname,
@@ -5,6 +5,7 @@ import json
 import shutil
 import anyio
 import logging
+import re
 from pathlib import Path
 from typing import Optional, List, Any
 from fastapi import APIRouter, Form, UploadFile, File, Request, Depends, HTTPException
@@ -16,7 +17,7 @@ from ...db import list_speakers
 from ...models import Job
 from ..utils import (
     read_preview, output_exists, xtts_outputs_for,
-    legacy_list_chapters, list_audiobooks
+    legacy_list_chapters, list_audiobooks, save_upload
 )
 
 # Compatibility for tests that monkeypatch these
@@ -29,6 +30,8 @@ XTTS_OUT_DIR = config.XTTS_OUT_DIR
 
 logger = logging.getLogger(__name__)
 
+_CHAPTER_HEADING_RE = re.compile(r'(?i)(Chapter\s+\d+.*?(?:\n|$))')
+
 
 def get_upload_dir() -> Path:
     return UPLOAD_DIR
@@ -72,13 +75,19 @@ def api_home(
     jobs = {j_id: job for j_id, job in get_jobs().items()}
     chapters = [p.name for p in legacy_list_chapters()]
 
+    # One listing of the output folder instead of two exists() probes per chapter
+    out_names = set()
+    if xtts_out_dir.exists():
+        with os.scandir(xtts_out_dir) as it:
+            out_names = {e.name for e in it}
+
     xtts_wav_only = []
     xtts_mp3 = []
     for c in chapters:
-        stem = Path(c).stem
-        if (xtts_out_dir / f"{stem}.mp3").exists():
+        stem = os.path.splitext(c)[0]
+        if f"{stem}.mp3" in out_names:
             xtts_mp3.append(c)
-        if (xtts_out_dir / f"{stem}.wav").exists():
+        if f"{stem}.wav" in out_names:
             xtts_wav_only.append(c)
 
     return {
@@ -157,7 +166,6 @@ async def upload(
     upload_dir: Path = Depends(get_upload_dir),
     chapter_dir: Path = Depends(get_chapter_dir)
 ):
-    file_content = await file.read()
     # Safe basename for protection
     safe_filename = os.path.basename(file.filename)
 
@@ -171,7 +179,7 @@ async def upload(
                 logger.warning(f"Blocking upload traversal attempt: {file.filename}")
                 raise HTTPException(status_code=403, detail="Invalid filename")
 
-            temp_path.write_bytes(file_content)
+            save_upload(file, temp_path)
         except Exception as e:
             if isinstance(e, HTTPException): raise
             logger.error(f"Upload failed for {file.filename}: {e}")
@@ -179,12 +187,11 @@ async def upload(
 
         # Logic to split file
         content = temp_path.read_text(encoding="utf-8", errors="replace")
-        import re
         chapter_filenames = []
         chapter_dir.mkdir(parents=True, exist_ok=True)
 
         # Simple split: "Chapter X:" or similar
-        parts = re.split(r'(?i)(Chapter\s+\d+.*?(?:\n|$))', content)
+        parts = _CHAPTER_HEADING_RE.split(content)
         if len(parts) > 1:
             # Re-assemble
             for i in range(1, len(parts), 2):
@@ -241,13 +248,7 @@ async def create_audiobook(
                  raise HTTPException(status_code=403, detail="Invalid cover path")
 
             cover_path = str(dest)
-            cover_content = await cover.read()
-
-            def save_cover():
-                with open(cover_path, "wb") as f:
-                    f.write(cover_content)
-
-            await anyio.to_thread.run_sync(save_cover)
+            await anyio.to_thread.run_sync(save_upload, cover, dest)
         except Exception as e:
             if isinstance(e, HTTPException): raise
             logger.error(f"Error saving cover: {e}")
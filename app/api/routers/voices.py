@@ -4,6 +4,7 @@ import shutil
 import time
 import anyio
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, List
 from fastapi import APIRouter, Form, File, UploadFile
@@ -17,6 +18,7 @@ from ... import config
 from ...state import get_settings, update_settings, get_jobs, put_job, update_job
 from ...jobs import get_speaker_settings, update_speaker_settings, enqueue
 from ...models import Job
+from ..utils import save_upload
 from fastapi import Depends
 
 # Compatibility for tests that monkeypatch these
@@ -30,12 +32,67 @@ def get_voices_dir() -> Path:
 
 router = APIRouter(prefix="/api", tags=["voices"])
 
+# Listing data per profile folder. Adding or removing a sample changes the folder's
+# mtime and settings changes rewrite profile.json, so both mtimes key the entry.
+_PROFILE_CACHE = {}
+_profile_cache_lock = threading.Lock()
+
+def _profile_listing(d: Path, fallback_speed) -> dict:
+    try:
+        meta_mtime = os.stat(d / "profile.json").st_mtime_ns
+    except OSError:
+        meta_mtime = None
+    key = (d.stat().st_mtime_ns, meta_mtime, fallback_speed)
+    with _profile_cache_lock:
+        cached = _PROFILE_CACHE.get(str(d))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with os.scandir(d) as it:
+        entries = {e.name for e in it}
+    raw_wavs = sorted([n for n in entries if n.endswith(".wav") and n != "sample.wav"])
+    spk_settings = get_speaker_settings(d.name)
+    built_samples = spk_settings.get("built_samples", [])
+
+    samples = []
+    is_rebuild_required = False
+    for w in raw_wavs:
+        is_new = w not in built_samples
+        samples.append({"name": w, "is_new": is_new})
+        if is_new: is_rebuild_required = True
+
+    if len([b for b in built_samples if b in entries]) < len(built_samples):
+         is_rebuild_required = True
+
+    has_test_wav = "sample.wav" in entries
+    if not has_test_wav and len(raw_wavs) > 0:
+        is_rebuild_required = True
+
+    listing = {
+        "name": d.name,
+        "wav_count": len(raw_wavs),
+        "samples_detailed": samples,
+        "samples": raw_wavs,
+        "is_rebuild_required": is_rebuild_required,
+        "speed": spk_settings["speed"],
+        "test_text": spk_settings["test_text"],
+        "speaker_id": spk_settings.get("speaker_id"),
+        "variant_name": spk_settings.get("variant_name"),
+        "preview_url": f"/out/voices/{d.name}/sample.wav" if has_test_wav else None
+    }
+    with _profile_cache_lock:
+        _PROFILE_CACHE[str(d)] = (key, listing)
+    return listing
+
 @router.get("/speaker-profiles")
 def list_speaker_profiles(voices_dir: Path = Depends(get_voices_dir)):
     if not voices_dir.exists():
         return []
 
-    dirs = sorted([d for d in voices_dir.iterdir() if d.is_dir()], key=lambda x: x.name)
+    # scandir reports entry types from the directory listing itself, so neither the
+    # profile list nor each profile's contents cost a stat per file
+    with os.scandir(voices_dir) as it:
+        dirs = sorted([Path(e.path) for e in it if e.is_dir()], key=lambda x: x.name)
     settings = get_settings()
     default_speaker = settings.get("default_speaker_profile")
 
@@ -49,38 +106,15 @@ def list_speaker_profiles(voices_dir: Path = Depends(get_voices_dir)):
             default_speaker = names[0] if len(dirs) > 0 else None
             update_settings({"default_speaker_profile": default_speaker})
 
+    fallback_speed = settings.get("xtts_speed")
     profiles = []
     for d in dirs:
-        raw_wavs = sorted([f.name for f in d.glob("*.wav") if f.name != "sample.wav"])
-        spk_settings = get_speaker_settings(d.name)
-        built_samples = spk_settings.get("built_samples", [])
-
-        samples = []
-        is_rebuild_required = False
-        for w in raw_wavs:
-            is_new = w not in built_samples
-            samples.append({"name": w, "is_new": is_new})
-            if is_new: is_rebuild_required = True
-
-        if len([b for b in built_samples if (d / b).exists()]) < len(built_samples):
-             is_rebuild_required = True
-
-        test_wav = voices_dir / d.name / "sample.wav"
-        if not test_wav.exists() and len(raw_wavs) > 0:
-            is_rebuild_required = True
-
+        listing = _profile_listing(d, fallback_speed)
         profiles.append({
-            "name": d.name,
+            **listing,
+            "samples_detailed": [dict(s) for s in listing["samples_detailed"]],
+            "samples": list(listing["samples"]),
             "is_default": d.name == default_speaker,
-            "wav_count": len(raw_wavs),
-            "samples_detailed": samples,
-            "samples": raw_wavs,
-            "is_rebuild_required": is_rebuild_required,
-            "speed": spk_settings["speed"],
-            "test_text": spk_settings["test_text"],
-            "speaker_id": spk_settings.get("speaker_id"),
-            "variant_name": spk_settings.get("variant_name"),
-            "preview_url": f"/out/voices/{d.name}/sample.wav" if test_wav.exists() else None
         })
     return profiles
 
@@ -233,13 +267,7 @@ async def build_speaker_profile(
     for f in files:
         if not f.filename:
             continue
-        content = await f.read()
-        dest = path / f.filename
-
-        def save_file(data, target):
-            target.write_bytes(data)
-
-        await anyio.to_thread.run_sync(save_file, content, dest)
+        await anyio.to_thread.run_sync(save_upload, f, path / f.filename)
         saved_files.append(f.filename)
 
     # Create build job
@@ -1,24 +1,51 @@
 import re
+import shutil
 import socket
 import json
 import subprocess
-import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 from .. import config
 from ..textops import split_by_chapter_markers, write_chapters_to_folder, split_into_parts
 
+# Preview text per chapter file, keyed like _PROBE_CACHE so an edited file is read again
+_PREVIEW_CACHE = {}
+_PREVIEW_CACHE_MAX = 64
+_preview_lock = threading.Lock()
+
 def read_preview(path: Path, max_chars: int = 8000) -> str:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return ""
+    key = (str(path), st.st_mtime_ns, st.st_size, max_chars)
+    with _preview_lock:
+        cached = _PREVIEW_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
         content = path.read_text(encoding="utf-8", errors="replace")
         if len(content) > max_chars:
-            return content[:max_chars] + ("\n\n...[preview truncated]..." if len(content) > max_chars else "")
-        return content
+            content = content[:max_chars] + "\n\n...[preview truncated]..."
     except:
         return ""
 
+    with _preview_lock:
+        if len(_PREVIEW_CACHE) >= _PREVIEW_CACHE_MAX:
+            del _PREVIEW_CACHE[next(iter(_PREVIEW_CACHE))]
+        _PREVIEW_CACHE[key] = content
+    return content
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+def save_upload(upload, dest: Path) -> None:
+    """Copy an UploadFile to dest in fixed-size chunks (blocking; run off the event loop)."""
+    upload.file.seek(0)
+    with open(dest, "wb") as out:
+        shutil.copyfileobj(upload.file, out, UPLOAD_CHUNK_SIZE)
+
 def output_exists(engine: str, chapter_file: str):
     if engine == "xtts":
         return (config.XTTS_OUT_DIR / f"{chapter_file}.wav").exists() or (config.XTTS_OUT_DIR / f"{chapter_file}.mp3").exists()
@@ -48,16 +75,26 @@ def legacy_list_chapters():
     config.CHAPTER_DIR.mkdir(parents=True, exist_ok=True)
     return sorted(config.CHAPTER_DIR.glob("*.txt"))
 
-def is_react_dev_active():
-    """Checks if the React dev server is running on 127.0.0.1:5173"""
+_react_dev_active = None
+
+def is_react_dev_active(refresh: bool = False):
+    """Checks if the React dev server is running on 127.0.0.1:5173.
+
+    The probe can block for up to its timeout, so the answer is kept for the life of the
+    process; pass refresh=True to probe again.
+    """
+    global _react_dev_active
+    if _react_dev_active is not None and not refresh:
+        return _react_dev_active
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(0.5)
         result = sock.connect_ex(('127.0.0.1', 5173))
         sock.close()
-        return result == 0
+        _react_dev_active = result == 0
     except:
-        return False
+        _react_dev_active = False
+    return _react_dev_active
 
 def process_and_split_file(filename: str, mode: str = "parts", max_chars: int = None) -> List[Path]:
     """Helper to split a file into chapters/parts in the CHAPTER_DIR."""
@@ -81,6 +118,55 @@ def process_and_split_file(filename: str, mode: str = "parts", max_chars: int =
         chapters = split_into_parts(full_text, max_chars, start_index=1)
         return write_chapters_to_folder(chapters, config.CHAPTER_DIR, prefix=stem, include_heading=False)
 
+# ffprobe results (title/duration tags) per m4b, keyed by (path, mtime_ns, size) so a
+# rebuilt file is probed again; the library page lists every book on each load
+_PROBE_CACHE = {}
+_PROBE_CACHE_MAX = 512
+_probe_lock = threading.Lock()
+
+def _probe_key(p: Path, st):
+    return (str(p), st.st_mtime_ns, st.st_size)
+
+def _probe_audiobook(p: Path, st) -> dict:
+    key = _probe_key(p, st)
+    with _probe_lock:
+        cached = _PROBE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    info = {}
+    try:
+        probe_cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration:format_tags=title", "-of", "json", str(p)]
+        probe_res = subprocess.run(probe_cmd, capture_output=True, text=True, check=True, timeout=3)
+        probe_data = json.loads(probe_res.stdout)
+        if "format" in probe_data:
+            fmt = probe_data["format"]
+            if "duration" in fmt:
+                info["duration_seconds"] = float(fmt["duration"])
+            if "tags" in fmt and "title" in fmt["tags"]:
+                info["title"] = fmt["tags"]["title"]
+    except:
+        # Not cached, so a transient failure (e.g. a timeout) is retried next time
+        return info
+
+    with _probe_lock:
+        if len(_PROBE_CACHE) >= _PROBE_CACHE_MAX:
+            del _PROBE_CACHE[next(iter(_PROBE_CACHE))]
+        _PROBE_CACHE[key] = info
+    return info
+
+def _probe_audiobooks(files) -> List[dict]:
+    """_probe_audiobook for each (path, stat) pair, in order. Uncached files are probed
+    a few at a time: each probe is an ffprobe process, so a new library doesn't wait
+    on them one after another."""
+    with _probe_lock:
+        misses = [i for i, (p, st) in enumerate(files) if _probe_key(p, st) not in _PROBE_CACHE]
+    probed = {}
+    if len(misses) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(misses))) as pool:
+            probed = dict(zip(misses, pool.map(lambda i: _probe_audiobook(*files[i]), misses)))
+    return [probed[i] if i in probed else _probe_audiobook(p, st) for i, (p, st) in enumerate(files)]
+
 def list_audiobooks():
     """Lists all audiobooks from legacy and project-specific directories."""
     res = []
@@ -97,10 +183,11 @@ def list_audiobooks():
                     for p in m4b_dir.glob("*.m4b"):
                         m4b_files.append((p, f"/projects/{proj_dir.name}/m4b/{p.name}"))
 
-    m4b_files.sort(key=lambda x: x[0].stat().st_mtime, reverse=True)
+    m4b_files = [(p, url, p.stat()) for p, url in m4b_files]
+    m4b_files.sort(key=lambda x: x[2].st_mtime, reverse=True)
 
-    for p, url in m4b_files:
-        st = p.stat()
+    probes = _probe_audiobooks([(p, st) for p, _, st in m4b_files])
+    for (p, url, st), info in zip(m4b_files, probes):
         item = {
             "filename": p.name, 
             "title": p.name, 
@@ -109,17 +196,7 @@ def list_audiobooks():
             "created_at": st.st_mtime,
             "size_bytes": st.st_size
         }
-        try:
-            probe_cmd = f"ffprobe -v error -show_entries format=duration:format_tags=title -of json {shlex.quote(str(p))}"
-            probe_res = subprocess.run(shlex.split(probe_cmd), capture_output=True, text=True, check=True, timeout=3)
-            probe_data = json.loads(probe_res.stdout)
-            if "format" in probe_data:
-                fmt = probe_data["format"]
-                if "duration" in fmt:
-                    item["duration_seconds"] = float(fmt["duration"])
-                if "tags" in fmt and "title" in fmt["tags"]:
-                    item["title"] = fmt["tags"]["title"]
-        except: pass
+        item.update(info)
 
         target_jpg = p.with_suffix(".jpg")
         if target_jpg.exists() and target_jpg.stat().st_size > 0:
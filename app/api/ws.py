@@ -1,34 +1,89 @@
 import asyncio
-from typing import List
+import json
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
 from fastapi import WebSocket
 
+# Broadcasts are encoded once, in the calling thread, and the same text frame goes to
+# every client (what send_json would produce, without re-encoding per connection)
+try:
+    import orjson
+
+    def _encode_message(message: dict) -> str:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    _encode_message = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# A client that can't take a message within this long is dropped (and closed, so it
+# reconnects) rather than left to fall further behind
+SEND_TIMEOUT = 2.0
+# Frames waiting for one client. job_updated frames are deltas, so none may be dropped: a
+# client that falls this far behind is closed instead, and resyncs when it reconnects.
+# Sized well above a burst (e.g. queueing a whole project), so only a stalled client hits it.
+CLIENT_QUEUE_SIZE = 256
+
+@dataclass
+class _Client:
+    websocket: WebSocket
+    queue: asyncio.Queue
+    writer: Optional[asyncio.Task] = None
+
 class ConnectionManager:
+    """
+    Each connection gets its own bounded outbound queue drained by a writer task, so a
+    broadcast only enqueues the (shared) payload and a slow client never holds up the rest.
+    """
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, _Client] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        client = _Client(websocket, asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE))
+        client.writer = asyncio.create_task(self._write(client))
+        self.active_connections[websocket] = client
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        client = self.active_connections.pop(websocket, None)
+        if client and client.writer:
+            client.writer.cancel()
 
     def broadcast(self, message: dict):
         # We need to broadcast from a non-async context sometimes (jobs.py or db.py)
-        # So we use the bridge approach or create a task
+        # So we use the bridge approach
         from ..web import _main_loop
         if _main_loop[0]:
-            _main_loop[0].call_soon_threadsafe(
-                lambda: asyncio.create_task(self._send_to_all(message))
-            )
+            payload = _encode_message(message)
+            _main_loop[0].call_soon_threadsafe(self._send_to_all, payload)
 
-    async def _send_to_all(self, message: dict):
-        for connection in self.active_connections:
+    def _send_to_all(self, payload: str):
+        for client in list(self.active_connections.values()):
             try:
-                await connection.send_json(message)
-            except:
-                pass
+                client.queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                self.disconnect(client.websocket)
+                asyncio.ensure_future(self._close(client.websocket))
+
+    async def _write(self, client: _Client):
+        websocket = client.websocket
+        try:
+            while True:
+                payload = await client.queue.get()
+                await asyncio.wait_for(websocket.send_text(payload), SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Gone or stalled: stop sending to it, and close it so the client reconnects
+            if self.active_connections.get(websocket) is client:
+                del self.active_connections[websocket]
+            await self._close(websocket)
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await asyncio.wait_for(websocket.close(), SEND_TIMEOUT)
+        except Exception:
+            pass
 
 manager = ConnectionManager()
 
@@ -47,12 +102,43 @@ def broadcast_pause_state(paused: bool):
         "paused": paused
     })
 
+# Job updates arrive on every progress tick. They are merged per job and sent at most
+# once per JOB_UPDATE_INTERVAL, as a single jobs_updated frame carrying every changed job
+# (job_id -> latest fields), however many jobs a burst touched.
+JOB_UPDATE_INTERVAL = 0.1
+_pending_job_updates: Dict[str, dict] = {}
+_pending_lock = threading.Lock()
+_flush_scheduled = False
+
 def broadcast_job_updated(job_id: str, updates: dict):
-    manager.broadcast({
-        "type": "job_updated",
-        "job_id": job_id,
-        "updates": updates
-    })
+    global _flush_scheduled
+    from ..web import _main_loop
+    loop = _main_loop[0]
+    if not loop:
+        return
+    with _pending_lock:
+        _pending_job_updates.setdefault(job_id, {}).update(updates)
+        if _flush_scheduled:
+            return
+        _flush_scheduled = True
+    try:
+        loop.call_soon_threadsafe(loop.call_later, JOB_UPDATE_INTERVAL, _flush_job_updates)
+    except RuntimeError:
+        # The loop is gone (shutdown); let a later update try again
+        with _pending_lock:
+            _flush_scheduled = False
+
+def _flush_job_updates():
+    global _flush_scheduled
+    with _pending_lock:
+        pending = dict(_pending_job_updates)
+        _pending_job_updates.clear()
+        _flush_scheduled = False
+    if pending:
+        manager._send_to_all(_encode_message({
+            "type": "jobs_updated",
+            "jobs": pending
+        }))
 
 def broadcast_test_progress(name: str, progress: float, started_at: float = None):
     manager.broadcast({
@@ -14,6 +14,8 @@ DB_PATH = Path(os.getenv("DB_PATH", "audiobook_studio.db"))
 def get_connection():
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    # WAL (enabled in init_db) is crash-safe at NORMAL; FULL would fsync on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
     return conn
 
 def init_db():
@@ -22,6 +24,11 @@ def init_db():
         with get_connection() as conn:
             cursor = conn.cursor()
 
+            # Write-ahead logging: per-job status writes append to the log instead of
+            # rewriting pages under an exclusive lock, and readers don't block on them.
+            # The mode is persistent, so this only does work the first time.
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             # Projects table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS projects (
@@ -1,7 +1,7 @@
 import os
-import subprocess
 from pathlib import Path
 from .core import _db_lock, get_connection
+from ..engines import get_audio_duration
 
 def reconcile_project_audio(project_id: str):
     """
@@ -34,17 +34,7 @@ def reconcile_project_audio(project_id: str):
                 if found_path:
                     duration = length or 0.0
                     if duration == 0.0:
-                        try:
-                            result = subprocess.run(
-                                ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", str(audio_dir / found_path)],
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.STDOUT,
-                                text=True,
-                                timeout=2
-                            )
-                            if result.returncode == 0:
-                                duration = float(result.stdout.strip())
-                        except: pass
+                        duration = get_audio_duration(audio_dir / found_path, timeout=2)
 
                     cursor.execute(
                         "UPDATE chapters SET audio_status = 'done', audio_file_path = ?, audio_length_seconds = ? WHERE id = ?", 
@@ -86,17 +76,7 @@ def reconcile_project_audio(project_id: str):
                 status, current_path = row
                 if status != 'done' or current_path != best_file:
                     audio_path = audio_dir / best_file
-                    duration = 0.0
-                    try:
-                        result = subprocess.run(
-                            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", str(audio_path)],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.STDOUT,
-                            text=True,
-                            timeout=2
-                        )
-                        duration = float(result.stdout.strip())
-                    except: pass
+                    duration = get_audio_duration(audio_path, timeout=2)
 
                     cursor.execute("""
                         UPDATE chapters 
@@ -1,16 +1,29 @@
 import shlex
+import shutil
+import struct
 import subprocess
+import tempfile
 import os
 import re
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .config import XTTS_ENV_ACTIVATE, MP3_QUALITY, BASE_DIR, AUDIOBOOK_BITRATE
 from .textops import safe_split_long_sentences, sanitize_for_xtts, pack_text_to_limit
 
+try:
+    from mutagen import File as _mutagen_file
+except ImportError:
+    _mutagen_file = None
+
 _active_processes = set()
 
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+_FIRST_NUMBER_RE = re.compile(r'(\d+)')
+
 def terminate_all_subprocesses():
     for proc in list(_active_processes):
         try:
@@ -104,6 +117,14 @@ def convert_to_wav(in_file: Path, out_wav: Path) -> int:
     cmd = f'ffmpeg -y -i {shlex.quote(str(in_file))} -ar 22050 -ac 1 {shlex.quote(str(out_wav))}'
     return subprocess.run(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
 
+def _run_xtts(cmd: str, out_wav: Path, on_output, cancel_check) -> int:
+    try:
+        return run_cmd_stream(cmd, on_output, cancel_check)
+    finally:
+        # xtts_inference.py streams into <out>.part and renames it once complete; a run that
+        # is cancelled (SIGTERM) or killed never gets to remove it itself
+        Path(f"{out_wav}.part").unlink(missing_ok=True)
+
 def xtts_generate(text: str, out_wav: Path, safe_mode: bool, on_output, cancel_check, speaker_wav: str = None, speed: float = 1.0) -> int:
     if not XTTS_ENV_ACTIVATE.exists():
         on_output(f"[error] XTTS activate not found: {XTTS_ENV_ACTIVATE}\n")
@@ -121,7 +142,7 @@ def xtts_generate(text: str, out_wav: Path, safe_mode: bool, on_output, cancel_c
         text = safe_split_long_sentences(text)
     else:
         # Raw mode: Absolute bare minimum to prevent speech engine crashes
-        text = re.sub(r'[^\x00-\x7F]+', '', text) # ASCII only
+        text = _NON_ASCII_RE.sub('', text) # ASCII only
         text = text.strip()
 
     text = pack_text_to_limit(text, pad=True) or " "
@@ -136,7 +157,7 @@ def xtts_generate(text: str, out_wav: Path, safe_mode: bool, on_output, cancel_c
         f"--speed {speed} "
         f"--out_path {shlex.quote(str(out_wav))}"
     )
-    return run_cmd_stream(cmd, on_output, cancel_check)
+    return _run_xtts(cmd, out_wav, on_output, cancel_check)
 
 
 def xtts_generate_script(script_json_path: Path, out_wav: Path, on_output, cancel_check, speed: float = 1.0) -> int:
@@ -153,21 +174,76 @@ def xtts_generate_script(script_json_path: Path, out_wav: Path, on_output, cance
         f"--speed {speed} "
         f"--out_path {shlex.quote(str(out_wav))}"
     )
-    return run_cmd_stream(cmd, on_output, cancel_check)
+    return _run_xtts(cmd, out_wav, on_output, cancel_check)
+
 
+# (path, mtime_ns, size) -> seconds. A rewritten file gets a new key, so entries never go stale.
+_DURATION_CACHE = {}
+_DURATION_CACHE_MAX = 512
+_duration_lock = threading.Lock()
+
+def _probe_duration(file_path: Path, timeout: Optional[float] = None) -> float:
+    if _mutagen_file is not None:
+        # Header parse in-process; no fork/exec of ffprobe
+        try:
+            audio = _mutagen_file(str(file_path))
+            if audio is not None and audio.info.length:
+                return float(audio.info.length)
+        except Exception:
+            pass
 
-def get_audio_duration(file_path: Path) -> float:
-    """Uses ffprobe to get the duration of an audio file in seconds."""
     cmd = [
         'ffprobe', '-v', 'error', '-show_entries', 'format=duration',
         '-of', 'default=noprint_wrappers=1:nokey=1', str(file_path)
     ]
     try:
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=timeout)
         return float(result.stdout.strip())
     except Exception:
         return 0.0
 
+def get_audio_duration(file_path: Path, timeout: Optional[float] = None) -> float:
+    """Returns the duration of an audio file in seconds, or 0.0 if it can't be read.
+
+    Uses mutagen when installed and ffprobe otherwise; results are cached by the
+    file's mtime and size so an unchanged file is only probed once.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return 0.0
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+    with _duration_lock:
+        cached = _DURATION_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    duration = _probe_duration(file_path, timeout)
+    if duration > 0:
+        with _duration_lock:
+            if len(_DURATION_CACHE) >= _DURATION_CACHE_MAX:
+                del _DURATION_CACHE[next(iter(_DURATION_CACHE))]
+            _DURATION_CACHE[key] = duration
+    return duration
+
+def get_audio_durations(file_paths: List[Path], timeout: Optional[float] = None) -> List[float]:
+    """get_audio_duration for each path, in order. Files that aren't cached yet are probed
+    from a few threads, since each probe may be an ffprobe process."""
+    misses = []
+    for i, p in enumerate(file_paths):
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        with _duration_lock:
+            if (str(p), st.st_mtime_ns, st.st_size) not in _DURATION_CACHE:
+                misses.append(i)
+    probed = {}
+    if len(misses) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(misses))) as pool:
+            probed = dict(zip(misses, pool.map(lambda i: get_audio_duration(file_paths[i], timeout), misses)))
+    return [probed[i] if i in probed else get_audio_duration(p, timeout) for i, p in enumerate(file_paths)]
+
 def get_speaker_latent_path(speaker_wavs_str: str) -> Optional[Path]:
     """Computes the same latent path as xtts_inference.py."""
     if not speaker_wavs_str:
@@ -216,7 +292,7 @@ def assemble_audiobook(
                     chapters_found[stem] = f
 
         def extract_number(filename):
-            match = re.search(r'(\d+)', filename)
+            match = _FIRST_NUMBER_RE.search(filename)
             return int(match.group(1)) if match else 0
 
         sorted_stems = sorted(chapters_found.keys(), key=lambda x: extract_number(x))
@@ -318,7 +394,6 @@ def assemble_audiobook(
         # 4. Copy cover art if successful so frontend can show it in the library
         if rc == 0 and cover_path and Path(cover_path).exists():
             try:
-                import shutil
                 cover_ext = Path(cover_path).suffix
                 cover_dest = output_m4b.with_suffix(cover_ext)
                 shutil.copy2(cover_path, cover_dest)
@@ -363,6 +438,31 @@ def generate_video_sample(
     cmd = f"ffmpeg -y {inputs} {logo_filter} -map 1:a -c:v libx264 -c:a copy -t {max_duration} -shortest {shlex.quote(str(output_video))}"
     return run_cmd_stream(cmd, on_output, cancel_check)
 
+_PCM16 = (1, 16)
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+def _wav_format(path: Path) -> Optional[Tuple[int, int]]:
+    """Returns (format tag, bits per sample) from a WAV header, or None if it can't be read."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read(12)[8:] != b"WAVE":
+                return None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                chunk_id, size = header[:4], struct.unpack("<I", header[4:])[0]
+                if chunk_id != b"fmt ":
+                    f.seek(size + (size & 1), os.SEEK_CUR)
+                    continue
+                fmt = f.read(size)
+                tag, bits = struct.unpack("<H", fmt[:2])[0], struct.unpack("<H", fmt[14:16])[0]
+                if tag == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+                    tag = struct.unpack("<H", fmt[24:26])[0]
+                return tag, bits
+    except (OSError, struct.error):
+        return None
+
 def stitch_segments(
     pdir: Path,
     segment_wavs: List[Path],
@@ -375,15 +475,31 @@ def stitch_segments(
         on_output("No segments to stitch.\n")
         return 1
 
-    list_file = output_path.with_suffix(".list.txt")
+    # Segments rendered before the switch to 16-bit output are float WAVs, and the concat
+    # demuxer decodes every input with the first file's codec. Copy any segment that isn't
+    # 16-bit PCM to a 16-bit temp file first, so the demuxer (one input, however many
+    # segments) always sees a uniform list.
+    work_dir = Path(tempfile.mkdtemp(prefix=".stitch_", dir=output_path.parent))
     try:
+        inputs = []
+        for i, sw in enumerate(segment_wavs):
+            if _wav_format(sw) == _PCM16:
+                inputs.append(sw)
+                continue
+            norm = work_dir / f"{i:05d}.wav"
+            rc = run_cmd_stream(
+                f"ffmpeg -y -i {shlex.quote(str(sw.absolute()))} -c:a pcm_s16le {shlex.quote(str(norm))}",
+                on_output, cancel_check
+            )
+            if rc != 0:
+                return rc
+            inputs.append(norm)
+
+        list_file = work_dir / "segments.txt"
         with open(list_file, 'w') as lf:
-            for sw in segment_wavs:
-                # Use absolute path for safety with safe 0
+            for sw in inputs:
                 lf.write(f"file '{sw.absolute()}'\n")
-
-        # Simple concat for segments (they should all be same sample rate/channels from XTTS)
-        cmd = f'ffmpeg -y -f concat -safe 0 -i {shlex.quote(str(list_file))} -c copy {shlex.quote(str(output_path))}'
+        cmd = f'ffmpeg -y -f concat -safe 0 -i {shlex.quote(str(list_file))} -c:a pcm_s16le {shlex.quote(str(output_path))}'
         return run_cmd_stream(cmd, on_output, cancel_check)
     finally:
-        if list_file.exists(): list_file.unlink()
+        shutil.rmtree(work_dir, ignore_errors=True)
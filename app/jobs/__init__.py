@@ -1,5 +1,5 @@
 import threading
-from .core import job_queue, assembly_queue, cancel_flags, pause_flag, paused, toggle_pause, set_paused, _estimate_seconds, calculate_predicted_progress, BASELINE_XTTS_CPS, format_seconds
+from .core import job_queue, assembly_queue, job_updates, cancel_flags, CancelFlag, pause_flag, paused, toggle_pause, set_paused, _estimate_seconds, calculate_predicted_progress, BASELINE_XTTS_CPS, format_seconds
 from .reconcile import cleanup_and_reconcile, _output_exists
 from .speaker import get_speaker_wavs, get_speaker_settings, update_speaker_settings
 from .worker import worker_loop
@@ -8,7 +8,7 @@ from ..config import CHAPTER_DIR, XTTS_OUT_DIR, AUDIOBOOK_DIR, VOICES_DIR, SAMPL
 
 def enqueue(job):
     put_job(job)
-    cancel_flags[job.id] = threading.Event()
+    cancel_flags[job.id] = CancelFlag()
     try:
         from ..db import upsert_queue_row
         upsert_queue_row(
@@ -42,18 +42,18 @@ def requeue(job_id):
     else: job_queue.put(job_id)
 
 def cancel(job_id):
-    ev = cancel_flags.get(job_id)
-    if ev: ev.set()
+    flag = cancel_flags.get(job_id)
+    if flag: flag.cancelled = True
 
 def clear_job_queue():
     for q in [job_queue, assembly_queue]:
         while not q.empty():
             try:
                 q.get_nowait()
-                q.task_done()
             except: break
 
 def start_workers():
+    job_updates.start()
     threading.Thread(target=worker_loop, args=(job_queue,), name="SynthesisWorker", daemon=True).start()
     threading.Thread(target=worker_loop, args=(assembly_queue,), name="AssemblyWorker", daemon=True).start()
 
@@ -1,18 +1,36 @@
 import queue
 import threading
-from typing import Dict
-from ..state import get_settings
+from collections import deque
+from typing import Dict, Iterable, Set, Tuple
+from ..state import get_settings, update_job, add_job_listener
 from ..config import BASELINE_XTTS_CPS
 
 # Queues and Flags
-job_queue: "queue.Queue[str]" = queue.Queue()
-assembly_queue: "queue.Queue[str]" = queue.Queue()
-cancel_flags: Dict[str, threading.Event] = {}
+# Queues of job ids. Nothing ever join()s them, so SimpleQueue's lighter C implementation
+# replaces queue.Queue (no task_done bookkeeping).
+job_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+assembly_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+
+class CancelFlag:
+    """
+    Cancellation bit for one job. A plain slotted attribute instead of a threading.Event:
+    nothing ever waits on it, workers only poll it, and a single attribute read/write is
+    atomic under the GIL.
+    """
+    __slots__ = ("cancelled",)
+
+    def __init__(self):
+        self.cancelled = False
+
+cancel_flags: Dict[str, CancelFlag] = {}
 pause_flag = threading.Event()
 
 # Default fallbacks
 # BASELINE_XTTS_CPS moved to config.py
 
+# Maximum number of log characters kept on a job (and broadcast to the UI)
+LOG_TAIL_CHARS = 20000
+
 def paused() -> bool:
     return pause_flag.is_set()
 
@@ -41,6 +59,112 @@ def format_seconds(seconds: int) -> str:
     hours, mins = divmod(minutes, 60)
     return f"{hours}h {mins}m {secs}s"
 
+class LogTail:
+    """
+    Rolling tail of a job's log lines.
+    Lines that fall entirely outside the last `limit` characters are dropped on append,
+    so each append costs O(len(line)) instead of re-joining the whole log.
+    """
+    def __init__(self, lines: Iterable[str] = (), limit: int = LOG_TAIL_CHARS):
+        self.limit = limit
+        self._lines = deque()
+        self._size = 0
+        for line in lines:
+            self.append(line)
+
+    def append(self, line: str):
+        self._lines.append(line)
+        self._size += len(line)
+        while len(self._lines) > 1 and self._size - len(self._lines[0]) >= self.limit:
+            self._size -= len(self._lines.popleft())
+
+    def __iter__(self):
+        return iter(self._lines)
+
+    def text(self) -> str:
+        """Returns the last `limit` characters of the log."""
+        joined = "".join(self._lines)
+        return joined[-self.limit:] if self._size > self.limit else joined
+
+class JobUpdateBuffer:
+    """
+    Hands per-line job updates (progress, log tail, warnings) from a worker's on_output
+    callback to a background thread, so the subprocess reader never waits on a
+    state.json write. Updates queued while a write is in flight are coalesced per job
+    and applied together.
+
+    Once a job reaches a terminal status its channel is closed and anything still
+    queued for it is dropped, so a stale log/progress doesn't land after 'done'. The
+    shared instance below gets its terminal notifications from a job listener.
+    """
+    TERMINAL = ("done", "failed", "cancelled")
+
+    def __init__(self):
+        self._q: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._closed = set()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="JobUpdater", daemon=True)
+            self._thread.start()
+
+    def open(self, jid: str):
+        """Accept updates for a job that is (re)starting."""
+        self._closed.discard(jid)
+
+    def push(self, jid: str, **updates):
+        self._q.put((jid, updates))
+
+    def _on_job_updated(self, jid, updates):
+        if updates.get("status") in self.TERMINAL:
+            self._closed.add(jid)
+            # Marks the end of the job's queued updates; the id is forgotten once it is drained
+            self._q.put((jid, None))
+
+    def _drain(self, first=None) -> Tuple[Dict[str, dict], Set[str]]:
+        batch: Dict[str, dict] = {}
+        finished = set()
+        item = first
+        while True:
+            if item is None:
+                try:
+                    item = self._q.get_nowait()
+                except queue.Empty:
+                    return batch, finished
+            jid, updates = item
+            if updates is None:
+                batch.pop(jid, None)
+                finished.add(jid)
+            else:
+                batch.setdefault(jid, {}).update(updates)
+            item = None
+
+    def _apply(self, drained: Tuple[Dict[str, dict], Set[str]]):
+        batch, finished = drained
+        for jid, updates in batch.items():
+            # Listeners run after the state lock is released, so _closed can lag behind a
+            # terminal write; skip_if_terminal re-checks the stored status inside update_job's
+            # critical section, where nothing can finish the job in between.
+            if jid in self._closed:
+                continue
+            try:
+                update_job(jid, skip_if_terminal=True, **updates)
+            except Exception as e:
+                print(f"Error applying buffered update for {jid}: {e}")
+        self._closed.difference_update(finished)
+
+    def flush(self):
+        """Synchronously apply everything queued so far."""
+        self._apply(self._drain())
+
+    def _run(self):
+        while True:
+            self._apply(self._drain(self._q.get()))
+
+job_updates = JobUpdateBuffer()
+add_job_listener(job_updates._on_job_updated)
+
 def calculate_predicted_progress(job, now: float, start_time: float, eta: int, limit: float = 0.85, prepare_limit: float = 0.05, prepare_step: float = 0.005) -> float:
     """Safely calculates the predicted progress floor for a job."""
     current_p = getattr(job, 'progress', 0.0)
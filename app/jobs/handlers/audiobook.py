@@ -38,6 +38,6 @@ def handle_audiobook_job(jid, j, start, logs, on_output, cancel_check):
 
         # We need the base_eta for tuning, but let's keep it simple for now or pass it in
         # For now, just mark done.
-        update_job(jid, status="done", project_id=j.project_id, chapter_id=j.chapter_id, finished_at=time.time(), progress=1.0, output_mp3=out_file.name, log="".join(logs))
+        update_job(jid, status="done", project_id=j.project_id, chapter_id=j.chapter_id, finished_at=time.time(), progress=1.0, output_mp3=out_file.name, log=logs.text())
     else:
-        update_job(jid, status="failed", project_id=j.project_id, chapter_id=j.chapter_id, finished_at=time.time(), progress=1.0, error=f"Audiobook assembly failed (rc={rc})", log="".join(logs))
+        update_job(jid, status="failed", project_id=j.project_id, chapter_id=j.chapter_id, finished_at=time.time(), progress=1.0, error=f"Audiobook assembly failed (rc={rc})", log=logs.text())
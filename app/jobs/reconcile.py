@@ -1,31 +1,88 @@
+import os
 import time
+import threading
 from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Tuple
 from .core import job_queue, assembly_queue, cancel_flags
 from ..state import get_jobs, update_job, delete_jobs
 from ..config import CHAPTER_DIR, XTTS_OUT_DIR, AUDIOBOOK_DIR
 
-def _output_exists(engine: str, chapter_file: str, project_id: str = None, make_mp3: bool = True) -> bool:
-    stem = Path(chapter_file).stem
+# Directory listings keyed by path, reused until the directory's mtime changes
+_DIR_INDEX: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+_DIR_INDEX_MAX = 256
+_DIR_INDEX_LOCK = threading.Lock()
+# Directories modified more recently than this are not listed at all, since a write
+# landing in the same mtime tick as the scan would go unnoticed; their paths are stat'ed.
+_DIR_INDEX_SETTLE_NS = 2_000_000_000
+
+def _dir_entries(d: Path) -> Optional[FrozenSet[str]]:
+    """
+    Returns the entry names of directory d, served from _DIR_INDEX while its mtime is unchanged,
+    or None if d was modified too recently for a listing to be trusted.
+    """
+    key = str(d)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        return frozenset()
+
+    cached = _DIR_INDEX.get(key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    if time.time_ns() - mtime_ns <= _DIR_INDEX_SETTLE_NS:
+        return None
+
+    try:
+        with os.scandir(key) as it:
+            names = frozenset(e.name for e in it)
+    except OSError:
+        return frozenset()
+
+    with _DIR_INDEX_LOCK:
+        _DIR_INDEX.pop(key, None)
+        if len(_DIR_INDEX) >= _DIR_INDEX_MAX:
+            del _DIR_INDEX[next(iter(_DIR_INDEX))]
+        _DIR_INDEX[key] = (mtime_ns, names)
+    return names
+
+def _path_exists(p: Path, cached: bool) -> bool:
+    if cached:
+        names = _dir_entries(p.parent)
+        if names is not None:
+            return p.name in names
+    return p.exists()
+
+def _xtts_paths(out_dir: Path, chapter_file: str) -> Tuple[Path, Path]:
+    """Returns the (wav, mp3) output paths for a chapter, deriving the stem only once."""
+    stem = os.path.splitext(os.path.basename(chapter_file))[0]
+    return out_dir / f"{stem}.wav", out_dir / f"{stem}.mp3"
+
+def _output_exists(engine: str, chapter_file: str, project_id: str = None, make_mp3: bool = True, cached: bool = False) -> bool:
+    """
+    Checks whether a job's output is already on disk.
+    With cached=True, lookups go through the per-directory listing index instead of
+    stat'ing each candidate path.
+    """
     if engine == "audiobook":
         if project_id:
             from ..config import get_project_m4b_dir
-            return (get_project_m4b_dir(project_id) / f"{chapter_file}.m4b").exists()
-        return (AUDIOBOOK_DIR / f"{chapter_file}.m4b").exists()
+            return _path_exists(get_project_m4b_dir(project_id) / f"{chapter_file}.m4b", cached)
+        return _path_exists(AUDIOBOOK_DIR / f"{chapter_file}.m4b", cached)
 
     if engine == "xtts":
         if project_id:
             from ..config import get_project_audio_dir
-            pdir = get_project_audio_dir(project_id)
-            mp3 = (pdir / f"{stem}.mp3").exists()
-            if not mp3:
-                mp3 = (XTTS_OUT_DIR / f"{stem}.mp3").exists()
-            wav = (pdir / f"{stem}.wav").exists()
-            if not wav:
-                wav = (XTTS_OUT_DIR / f"{stem}.wav").exists()
+            wav_path, mp3_path = _xtts_paths(get_project_audio_dir(project_id), chapter_file)
+            mp3 = _path_exists(mp3_path, cached)
+            wav = _path_exists(wav_path, cached)
+            if not (mp3 and wav):
+                legacy_wav, legacy_mp3 = _xtts_paths(XTTS_OUT_DIR, chapter_file)
+                mp3 = mp3 or _path_exists(legacy_mp3, cached)
+                wav = wav or _path_exists(legacy_wav, cached)
         else:
-            pdir = XTTS_OUT_DIR
-            mp3 = (pdir / f"{stem}.mp3").exists()
-            wav = (pdir / f"{stem}.wav").exists()
+            wav_path, mp3_path = _xtts_paths(XTTS_OUT_DIR, chapter_file)
+            mp3 = _path_exists(mp3_path, cached)
+            wav = _path_exists(wav_path, cached)
     else:
         return False
 
@@ -78,6 +135,7 @@ def cleanup_and_reconcile():
 
     # 2. Reconcile missing audio
     reset_ids = []
+    project_chapters = {}  # project_id -> its chapters, fetched once per pass
     for jid, j in all_jobs.items():
         if j.status == "done":
             if j.engine == "audiobook" or j.id == "mp3-backfill-task" or "Backfill" in j.chapter_file:
@@ -90,7 +148,8 @@ def cleanup_and_reconcile():
                 j.engine, 
                 j.chapter_file, 
                 project_id=j.project_id, 
-                make_mp3=j.make_mp3
+                make_mp3=j.make_mp3,
+                cached=True
             )
 
             if not exists:
@@ -115,29 +174,22 @@ def cleanup_and_reconcile():
                     pdir = get_project_audio_dir(j.project_id) if j.project_id else XTTS_OUT_DIR
                     output_file = j.output_mp3 or j.output_wav
                     if output_file:
-                        import subprocess
+                        from ..engines import get_audio_duration
                         audio_path = pdir / output_file
                         if not audio_path.exists():
                             audio_path = XTTS_OUT_DIR / output_file
 
                         if audio_path.exists():
-                            try:
-                                result = subprocess.run(
-                                    ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", str(audio_path)],
-                                    stdout=subprocess.PIPE,
-                                    stderr=subprocess.STDOUT,
-                                    text=True,
-                                    timeout=2
-                                )
-                                audio_length = float(result.stdout.strip())
-                            except Exception: pass
+                            audio_length = get_audio_duration(audio_path, timeout=2)
                     update_queue_item(jid, "done", audio_length_seconds=audio_length)
 
                     cid = j.chapter_id
                     if not cid and j.project_id:
                         try:
-                            from ..db import list_chapters
-                            chaps = list_chapters(j.project_id)
+                            chaps = project_chapters.get(j.project_id)
+                            if chaps is None:
+                                from ..db import list_chapters
+                                chaps = project_chapters[j.project_id] = list_chapters(j.project_id)
                             for c in chaps:
                                 if c.get("id") and j.chapter_file.startswith(c["id"]):
                                     cid = c["id"]
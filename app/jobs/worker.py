@@ -1,20 +1,37 @@
 import time
 import os
 import re
-import threading
 import traceback
-from pathlib import Path
+from datetime import datetime
 from .core import (
-    job_queue, assembly_queue, cancel_flags, pause_flag,
-    BASELINE_XTTS_CPS, _estimate_seconds, format_seconds, calculate_predicted_progress
+    job_queue, assembly_queue, cancel_flags, CancelFlag, pause_flag,
+    BASELINE_XTTS_CPS, _estimate_seconds, format_seconds, calculate_predicted_progress,
+    LogTail, LOG_TAIL_CHARS, job_updates
 )
 from ..state import get_jobs, update_job, get_performance_metrics, update_performance_metrics
 from ..config import CHAPTER_DIR, XTTS_OUT_DIR, AUDIOBOOK_DIR, SAMPLES_DIR
-from .reconcile import _output_exists
+from .reconcile import _output_exists, _xtts_paths
 from .speaker import get_speaker_wavs, get_speaker_settings
 from .handlers.audiobook import handle_audiobook_job
 from .handlers.xtts import handle_xtts_job
 
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+_HEADER_RULE = "-" * 40 + "\n\n"
+# tqdm progress lines look like "Synthesizing:  42%|████      | ..."
+_PCT_RE = re.compile(r'(\d+)%')
+
+def _build_header(title: str, start_dt: str, engine_label: str, details: list, eta: int) -> str:
+    """Formats the log header written when a job starts."""
+    lines = "".join(f"{d}\n" for d in details)
+    return (
+        f"Job Started: {title}\n"
+        f"Started At:  {start_dt}\n"
+        f"Engine: {engine_label}\n"
+        f"{lines}"
+        f"Predicted Duration: {format_seconds(eta)}\n"
+        f"{_HEADER_RULE}"
+    )
+
 def worker_loop(q):
     while True:
         jid = q.get()
@@ -22,18 +39,23 @@ def worker_loop(q):
             j = get_jobs().get(jid)
             if not j or j.id == "mp3-backfill-task":
                 continue
+            # Cancelled (or otherwise finished) while it waited in the queue
+            if j.status in ("done", "failed", "cancelled"):
+                continue
 
             while pause_flag.is_set() and not j.bypass_pause and j.engine != "audiobook":
                 time.sleep(0.2)
 
-            cancel_ev = cancel_flags.get(jid) or threading.Event()
-            cancel_flags[jid] = cancel_ev
+            cancel_flag = cancel_flags.get(jid) or CancelFlag()
+            cancel_flags[jid] = cancel_flag
 
-            start_dt = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time()))
+            start_dt = datetime.now().strftime(_TS_FMT)
             chars = 0
             eta = 0
-            header = []
+            header = ""
             text = None
+            initial_status = "running" if j.engine == "audiobook" else "preparing"
+            initial_start = time.time()
 
             if j.engine != "audiobook":
                 if j.project_id:
@@ -42,7 +64,17 @@ def worker_loop(q):
                 else:
                     text_path = CHAPTER_DIR / j.chapter_file
 
-                if text_path.exists():
+                try:
+                    text_size = text_path.stat().st_size
+                except OSError:
+                    text_size = None
+
+                if text_size is not None:
+                    # Publish a provisional, size-based ETA so the UI reacts before the read
+                    # (bytes ~= chars for mostly-ASCII prose); it is corrected below.
+                    perf = get_performance_metrics()
+                    approx_eta = _estimate_seconds(text_size, perf.get("xtts_cps", BASELINE_XTTS_CPS)) if text_size else 0
+                    update_job(jid, status=initial_status, started_at=initial_start, eta_seconds=approx_eta)
                     text = text_path.read_text(encoding="utf-8", errors="replace")
                     chars = len(text)
                 elif j.segment_ids:
@@ -66,14 +98,7 @@ def worker_loop(q):
                     cps = perf.get("xtts_cps", BASELINE_XTTS_CPS)
                     eta = _estimate_seconds(chars, cps)
 
-                header = [
-                    f"Job Started: {j.chapter_file}\n",
-                    f"Started At:  {start_dt}\n",
-                    f"Engine: {j.engine.upper()}\n",
-                    f"Character Count: {chars:,}\n",
-                    f"Predicted Duration: {format_seconds(eta)}\n",
-                    "-" * 40 + "\n\n"
-                ]
+                header = _build_header(j.chapter_file, start_dt, j.engine.upper(), [f"Character Count: {chars:,}"], eta)
             else:
                 if j.project_id:
                     from ..config import get_project_audio_dir
@@ -87,34 +112,34 @@ def worker_loop(q):
                     audio_files = [f for f in os.listdir(src_dir) if f.endswith(('.wav', '.mp3'))] if src_dir.exists() else []
 
                 num_files = len(audio_files)
-                total_size_mb = sum((src_dir / f).stat().st_size for f in audio_files if (src_dir / f).exists()) / (1024 * 1024) if src_dir.exists() else 0
+                total_bytes = 0
+                if src_dir.exists():
+                    # One scandir pass: a single stat per matching entry, no exists() probe per file
+                    wanted = set(audio_files)
+                    with os.scandir(src_dir) as it:
+                        total_bytes = sum(e.stat().st_size for e in it if e.name in wanted)
+                total_size_mb = total_bytes / (1024 * 1024)
 
                 perf = get_performance_metrics()
                 mult = perf.get("audiobook_speed_multiplier", 1.0)
                 base_eta = (num_files * 0.02) + (total_size_mb / 10)
                 eta = max(15, int(base_eta * mult))
 
-                header = [
-                    f"Job Started: Audiobook {j.chapter_file}\n",
-                    f"Started At:  {start_dt}\n",
-                    "Engine: AUDIOBOOK ASSEMBLY\n",
-                    f"Chapter Files: {num_files}\n",
-                    f"Total Source Size: {total_size_mb:.1f} MB\n",
-                    f"Predicted Duration: {format_seconds(eta)}\n",
-                    "-" * 40 + "\n\n"
-                ]
+                header = _build_header(
+                    f"Audiobook {j.chapter_file}", start_dt, "AUDIOBOOK ASSEMBLY",
+                    [f"Chapter Files: {num_files}", f"Total Source Size: {total_size_mb:.1f} MB"], eta
+                )
 
-            initial_status = "running" if j.engine == "audiobook" else "preparing"
-            initial_start = time.time()
-            update_job(jid, status=initial_status, started_at=initial_start, eta_seconds=eta, log="".join(header))
+            update_job(jid, status=initial_status, started_at=initial_start, eta_seconds=eta, log=header)
 
             j.status = initial_status
             j.progress = 0.0
-            j.log = "".join(header)
+            j.log = header
             j.started_at = initial_start
-            j._last_broadcast_p = 0.0
+            j.warning_count = j.warning_count or 0
+            is_segment = bool(j.is_bake or j.segment_ids)
 
-            if j.engine != "audiobook" and not (text_path.exists() or j.segment_ids or j.is_bake):
+            if j.engine != "audiobook" and not (text is not None or j.segment_ids or j.is_bake):
                 update_job(jid, status="failed", finished_at=time.time(), progress=1.0, error=f"Chapter file not found: {j.chapter_file}")
                 continue
 
@@ -122,10 +147,15 @@ def worker_loop(q):
                 update_job(jid, status="done", finished_at=time.time(), progress=1.0, log="Skipped: output already exists.")
                 continue
 
-            logs = header.copy()
+            logs = LogTail([header])
+            job_updates.open(jid)
             start = time.time()
+            # Job is slotted, so the broadcast markers live in the closure rather than on j
+            last_broadcast_p = 0.0
+            last_broadcast_time = 0.0
 
             def on_output(line):
+                nonlocal last_broadcast_p, last_broadcast_time
                 s = line.strip()
                 now = time.time()
                 new_progress = None
@@ -133,14 +163,12 @@ def worker_loop(q):
 
                 if not s:
                     prog = calculate_predicted_progress(j, now, start, eta, limit=0.98, prepare_limit=0.01, prepare_step=0.001)
-                    last_b = getattr(j, '_last_broadcast_time', 0)
-                    last_p = getattr(j, '_last_broadcast_p', 0.0)
-                    if (prog - last_p >= 0.01) or (now - last_b >= 30.0):
+                    if (prog - last_broadcast_p >= 0.01) or (now - last_broadcast_time >= 30.0):
                         prog = round(prog, 2)
                         j.progress = prog
-                        j._last_broadcast_time = now
-                        j._last_broadcast_p = prog
-                        update_job(jid, progress=prog)
+                        last_broadcast_time = now
+                        last_broadcast_p = prog
+                        job_updates.push(jid, progress=prog)
                     return
 
                 if "[START_SYNTHESIS]" in s:
@@ -154,40 +182,39 @@ def worker_loop(q):
                 if any(x in s.lower() for x in ["> text", "> processing sentence", "pkg_resources is deprecated", "using model:", "already downloaded", "futurewarning", "loading model", "tensorboard", "processing time", "real-time factor"]): return
                 if s.startswith(("['", '["', "'", '"')): return
 
-                progress_match = re.search(r'(\d+)%', s)
-                is_progress = progress_match and "|" in s
-                is_segment = getattr(j, 'is_bake', False) or getattr(j, 'segment_ids', False)
-
-                if is_progress and getattr(j, 'synthesis_started_at', None) and not is_segment:
+                # Only tqdm bars contain both '%' and '|'; skip the regex for every other line
+                progress_match = _PCT_RE.search(s) if ("%" in s and "|" in s) else None
+                is_progress = progress_match is not None
+                if is_progress and j.synthesis_started_at and not is_segment:
                     try:
                         p_val = round(int(progress_match.group(1)) / 100.0, 2)
-                        if p_val > getattr(j, 'progress', 0.0): new_progress = p_val
+                        if p_val > j.progress: new_progress = p_val
                     except: pass
 
                 if not is_progress:
                     if "exceeds the character limit" in s:
-                        j.warning_count = getattr(j, 'warning_count', 0) + 1
-                        update_job(jid, warning_count=j.warning_count)
+                        j.warning_count += 1
+                        job_updates.push(jid, warning_count=j.warning_count)
                     if not (s.startswith(("[", ">")) and len(s) > 20):
                         logs.append(line)
-                        new_log = "".join(logs)[-20000:]
+                        new_log = logs.text()
 
-                broadcast_p = getattr(j, '_last_broadcast_p', 0.0)
+                broadcast_p = last_broadcast_p
                 if new_progress is None and not is_segment:
                     new_progress = round(calculate_predicted_progress(j, now, start, eta, limit=0.85, prepare_limit=0.05, prepare_step=0.005), 2)
 
                 include_p = new_progress is not None and ((abs(new_progress - broadcast_p) >= 0.01) or (broadcast_p == 0 and new_progress > 0))
                 if new_log or include_p:
-                    j._last_broadcast_time = now
+                    last_broadcast_time = now
                     args = {}
                     if include_p:
                         j.progress = new_progress
-                        j._last_broadcast_p = new_progress
+                        last_broadcast_p = new_progress
                         args['progress'] = new_progress
                     if new_log: args['log'] = new_log
-                    update_job(jid, **args)
+                    job_updates.push(jid, **args)
 
-            def cancel_check(): return cancel_ev.is_set()
+            def cancel_check(): return cancel_flag.cancelled
 
             if j.engine == "audiobook":
                 handle_audiobook_job(jid, j, start, logs, on_output, cancel_check)
@@ -196,8 +223,7 @@ def worker_loop(q):
             elif j.engine == "xtts":
                 from ..config import get_project_audio_dir
                 pdir = get_project_audio_dir(j.project_id) if j.project_id else XTTS_OUT_DIR
-                out_wav = pdir / f"{Path(j.chapter_file).stem}.wav"
-                out_mp3 = pdir / f"{Path(j.chapter_file).stem}.mp3"
+                out_wav, out_mp3 = _xtts_paths(pdir, j.chapter_file)
 
                 sw = get_speaker_wavs(j.speaker_profile)
                 spk = get_speaker_settings(j.speaker_profile)
@@ -205,8 +231,8 @@ def worker_loop(q):
                 handle_xtts_job(jid, j, start, logs, on_output, cancel_check, sw, spk["speed"], pdir, out_wav, out_mp3, text=text)
 
                 # Auto-tuning
-                if not getattr(j, 'is_bake', False):
-                    eff_start = getattr(j, 'synthesis_started_at', None) or start
+                if not j.is_bake:
+                    eff_start = j.synthesis_started_at or start
                     dur = time.time() - eff_start
                     if dur > 0 and chars > 0:
                         new_cps = chars / dur
@@ -215,7 +241,8 @@ def worker_loop(q):
 
         except Exception:
             tb = traceback.format_exc()
-            try: update_job(jid, status="failed", finished_at=time.time(), progress=1.0, error="Worker crashed.", log=tb[-20000:])
+            try: update_job(jid, status="failed", finished_at=time.time(), progress=1.0, error="Worker crashed.", log=tb[-LOG_TAIL_CHARS:])
             except: print(f"FATAL: could not update job {jid}\n{tb}")
         finally:
-            q.task_done()
+            # The job is through with its flag; a requeue starts from a fresh one
+            cancel_flags.pop(jid, None)
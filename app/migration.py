@@ -1,7 +1,6 @@
 import os
 import uuid
 import time
-from pathlib import Path
 from .config import CHAPTER_DIR, XTTS_OUT_DIR
 from .db import get_connection, create_project
 
@@ -10,7 +9,8 @@ def import_legacy_filesystem_data():
     Scans CHAPTER_DIR for .txt files and matches them with audio in XTTS_OUT_DIR.
     Creates a 'Legacy Import' project and populates it with chapters.
     """
-    txt_files = [f for f in os.listdir(CHAPTER_DIR) if f.endswith('.txt')]
+    with os.scandir(CHAPTER_DIR) as it:
+        txt_files = [e.name for e in it if e.name.endswith('.txt') and e.is_file()]
     if not txt_files:
         return {"status": "success", "message": "No legacy text files found."}
 
@@ -21,12 +21,23 @@ def import_legacy_filesystem_data():
         author="System"
     )
 
-    imported_count = 0
+    # Index existing audio once instead of probing two paths per chapter
+    mp3_stems, wav_stems = set(), set()
+    if XTTS_OUT_DIR.exists():
+        with os.scandir(XTTS_OUT_DIR) as it:
+            for e in it:
+                stem, ext = os.path.splitext(e.name)
+                if ext == '.mp3':
+                    mp3_stems.add(stem)
+                elif ext == '.wav':
+                    wav_stems.add(stem)
+
     with get_connection() as conn:
         cursor = conn.cursor()
 
+        rows = []
         for txt_name in txt_files:
-            stem = Path(txt_name).stem
+            stem = os.path.splitext(txt_name)[0]
             txt_path = CHAPTER_DIR / txt_name
 
             # Read content
@@ -43,37 +54,35 @@ def import_legacy_filesystem_data():
             audio_status = 'unprocessed'
 
             # Priority .mp3 > .wav
-            for ext in ['.mp3', '.wav']:
-                potential_audio = XTTS_OUT_DIR / f"{stem}{ext}"
-                if potential_audio.exists():
-                    audio_file = potential_audio.name
-                    audio_status = 'done'
-                    break
-
-            chap_id = str(uuid.uuid4())
-            now = time.time()
+            if stem in mp3_stems:
+                audio_file = f"{stem}.mp3"
+                audio_status = 'done'
+            elif stem in wav_stems:
+                audio_file = f"{stem}.wav"
+                audio_status = 'done'
 
-            # Insert into chapters
-            cursor.execute("""
-                INSERT INTO chapters (
-                    id, project_id, title, text_content, sort_order, 
-                    audio_status, audio_file_path, text_last_modified, 
-                    char_count, word_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                chap_id,
+            rows.append((
+                str(uuid.uuid4()),
                 project_id,
                 stem,
                 content,
-                imported_count,
+                len(rows),
                 audio_status,
                 audio_file,
-                now,
+                time.time(),
                 char_count,
                 word_count
             ))
-            imported_count += 1
 
+        # Insert into chapters in one batch so SQLite prepares the statement once
+        cursor.executemany("""
+            INSERT INTO chapters (
+                id, project_id, title, text_content, sort_order, 
+                audio_status, audio_file_path, text_last_modified, 
+                char_count, word_count
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        imported_count = len(rows)
         conn.commit()
 
     return {
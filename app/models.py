@@ -1,10 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional, Literal, List
 
 Engine = Literal["xtts", "audiobook"]
 Status = Literal["queued", "preparing", "running", "finalizing", "done", "failed", "cancelled"]
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     id: str
     engine: Engine
@@ -41,3 +41,6 @@ class Job:
     cover_path: Optional[str] = None
     segment_ids: Optional[List[str]] = None
     is_bake: bool = False
+
+# Field names of the current Job schema, used to drop stale keys from persisted jobs
+JOB_FIELDS = frozenset(f.name for f in fields(Job))
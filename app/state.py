@@ -1,23 +1,151 @@
+import atexit
+import copy
+import itertools
 import json
 import os
 import threading
+import time
+from contextlib import contextmanager
 from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from json import JSONDecodeError
 
-from .models import Job
-from .config import BASE_DIR
+from .models import Job, JOB_FIELDS
+from .config import BASE_DIR, XTTS_OUT_DIR, get_project_audio_dir
+from .db import update_queue_item
+from .engines import get_audio_duration
 
 STATE_FILE = Path(os.getenv("STATE_FILE", str(BASE_DIR / "state.json")))
 
-# IMPORTANT: RLock prevents deadlock when a function that holds the lock calls another that also locks.
-_STATE_LOCK = threading.RLock()
-_JOB_LISTENERS = []
+# state.json is a machine artifact rewritten on most state changes, so it is written compactly
+# (orjson when installed, else the stdlib C encoder). Set STATE_PRETTY=1 for an indented file.
+_STATE_PRETTY = os.getenv("STATE_PRETTY") == "1"
+try:
+    import orjson
+
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _STATE_PRETTY else 0)
+
+    def _dump_state(state: Dict[str, Any]) -> bytes:
+        return orjson.dumps(state, option=_ORJSON_OPTS)
+
+    def _dump_record(record: Dict[str, Any]) -> bytes:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+    _load_state_bytes = orjson.loads
+except ImportError:
+    _encode = json.JSONEncoder(indent=2).encode if _STATE_PRETTY else json.JSONEncoder(separators=(",", ":")).encode
+
+    _encode_record = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _dump_state(state: Dict[str, Any]) -> bytes:
+        return _encode(state).encode("utf-8")
+
+    def _dump_record(record: Dict[str, Any]) -> bytes:
+        return (_encode_record(record) + "\n").encode("utf-8")
+
+    def _load_state_bytes(raw: bytes) -> Dict[str, Any]:
+        return json.loads(raw.decode("utf-8", errors="replace"))
+
+
+class _StateLock:
+    """
+    Reader-writer lock for the state.
+    `with _STATE_LOCK:` takes the exclusive (write) side, which is re-entrant like the RLock
+    it replaces, so a function holding it can call another that also locks. `read()` is the
+    shared side used by getters; the thread holding the write side may also read. Waiting
+    writers block new readers so UI polling can't starve the worker's updates.
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+
+    def __enter__(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return self
+            self._writers_waiting += 1
+            while self._writer is not None or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read(self):
+        if self._writer == threading.get_ident():
+            yield
+            return
+        with self._cond:
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+
+_STATE_LOCK = _StateLock()
+# Replaced (never mutated) on registration, so update_job can iterate it without a lock
+_JOB_LISTENERS: tuple = ()
+_LISTENERS_LOCK = threading.Lock()
+# update_job's SQLite syncs run outside _STATE_LOCK but in the order of the state changes:
+# each draws a ticket while it still holds the state lock and waits for its turn after
+_SYNC_TICKETS = itertools.count()
+_SYNC_TURN = threading.Condition()
+_sync_now_serving = 0
+
+# Auto-tuned metrics are kept in memory and written to state.json at most this often
+PERF_FLUSH_INTERVAL = 10.0
+_PERF_PENDING: Dict[str, Any] = {}
+_PERF_LAST_FLUSH = 0.0
+
+# Parsed state.json, reused while the file's stat signature is unchanged. Write paths
+# mutate it in place and persist it, so updates no longer re-parse the file first.
+_STATE_CACHE: Optional[Dict[str, Any]] = None
+_STATE_CACHE_KEY: Optional[tuple] = None
+
+# Mutations are written back by a background thread; updates landing within
+# STATE_WRITE_DELAY of each other are persisted with a single write.
+STATE_WRITE_DELAY = 0.1
+_DIRTY = threading.Event()
+_DIRTY_PATH: Optional[Path] = None  # file the cached state still has to be written to
+_WRITER_THREAD: Optional[threading.Thread] = None
+
+# update_job's changes are appended to a log next to state.json (one JSON record per line)
+# rather than rewriting the whole file. The log starts with the stat signature of the
+# state.json it extends and is only replayed on top of that exact file, so a full rewrite
+# (any other mutation, or the log outgrowing STATE_LOG_MAX_BYTES) simply starts a new one.
+STATE_LOG_MAX_BYTES = 4 * 1024 * 1024
+_PENDING_UPDATES: Dict[str, Dict[str, Any]] = {}  # job id -> fields changed since the last flush
+_FULL_WRITE = False
+_LOG_BASE: Optional[tuple] = None  # (state.json path, signature) the log on disk extends
 
 def add_job_listener(callback):
-    """Register a callback to be notified of job updates."""
-    _JOB_LISTENERS.append(callback)
+    """
+    Register a callback to be notified of job updates.
+    Callbacks run after the state lock is released, so they may call back into this module.
+    """
+    global _JOB_LISTENERS
+    with _LISTENERS_LOCK:
+        _JOB_LISTENERS = _JOB_LISTENERS + (callback,)
 
 
 def _default_state() -> Dict[str, Any]:
@@ -35,30 +163,203 @@ def _default_state() -> Dict[str, Any]:
     }
 
 
-def _atomic_write_text(path: Path, text: str) -> None:
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(text, encoding="utf-8")
+    tmp_path.write_bytes(data)
     os.replace(tmp_path, path)
 
 
+def _log_file(path: Path) -> Path:
+    return path.with_suffix(".log")
+
+
+def _file_signature(path: Path) -> tuple:
+    st = path.stat()
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _state_file_key() -> tuple:
+    try:
+        log_sig = _file_signature(_log_file(STATE_FILE))
+    except OSError:
+        log_sig = None
+    return (str(STATE_FILE), _file_signature(STATE_FILE), log_sig)
+
+
+def _append_log_bytes(path: Path, data: bytes) -> None:
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+def _write_snapshot(path: Path, state: Dict[str, Any]) -> None:
+    """Writes the full state to path and starts an empty update log on top of it."""
+    global _LOG_BASE
+    _atomic_write_bytes(path, _dump_state(state))
+    base = _file_signature(path)
+    _atomic_write_bytes(_log_file(path), _dump_record({"op": "base", "state": list(base)}))
+    _LOG_BASE = (str(path), base)
+
+
+def _log_extends(path: Path) -> bool:
+    """True if the update log on disk was started from path as it is now."""
+    if _LOG_BASE is None or _LOG_BASE[0] != str(path):
+        return False
+    try:
+        return _file_signature(path) == _LOG_BASE[1] and _log_file(path).stat().st_size <= STATE_LOG_MAX_BYTES
+    except OSError:
+        return False
+
+
+def _replay_log(state: Dict[str, Any], path: Path, base: tuple) -> None:
+    """Applies the update log to state parsed from path, if the log was started from it."""
+    global _LOG_BASE
+    try:
+        with open(_log_file(path), "rb") as f:
+            header = _load_state_bytes(f.readline())
+            if not isinstance(header, dict) or header.get("op") != "base" or tuple(header.get("state") or ()) != base:
+                return
+            jobs = state.get("jobs", {})
+            for line in f:
+                try:
+                    record = _load_state_bytes(line)
+                except ValueError:
+                    break  # torn final append
+                j = jobs.get(record.get("id"))
+                if j is not None:
+                    j.update(record.get("fields", {}))
+    except (OSError, ValueError):
+        return
+    _LOG_BASE = (str(path), base)
+
+
+def _write_state_no_lock(state: Dict[str, Any]) -> None:
+    """
+    Internal helper: assumes caller already holds _STATE_LOCK.
+    Persists state and keeps it as the cached copy.
+    """
+    global _STATE_CACHE, _STATE_CACHE_KEY
+    try:
+        _write_snapshot(STATE_FILE, state)
+        _STATE_CACHE, _STATE_CACHE_KEY = state, _state_file_key()
+    except BaseException:
+        # The cached dict may already hold the unsaved changes; re-read next time
+        _STATE_CACHE = _STATE_CACHE_KEY = None
+        raise
+
+
+def _queue_write_no_lock(state: Dict[str, Any], full: bool = True) -> None:
+    """
+    Internal helper: assumes caller already holds _STATE_LOCK.
+    Adopts state as the cached copy and schedules it to be written by the writer thread.
+    """
+    global _STATE_CACHE, _DIRTY_PATH, _WRITER_THREAD, _FULL_WRITE
+    _STATE_CACHE = state
+    _FULL_WRITE = _FULL_WRITE or full
+    _DIRTY_PATH = STATE_FILE
+    if _WRITER_THREAD is None:
+        _WRITER_THREAD = threading.Thread(target=_writer_loop, name="StateWriter", daemon=True)
+        _WRITER_THREAD.start()
+    _DIRTY.set()
+
+
+def _queue_job_update_no_lock(state: Dict[str, Any], job_id: str, fields: Dict[str, Any]) -> None:
+    """
+    Internal helper: assumes caller already holds _STATE_LOCK.
+    Like _queue_write_no_lock, for a change to only these fields of one job.
+    """
+    _PENDING_UPDATES.setdefault(job_id, {}).update(fields)
+    _queue_write_no_lock(state, full=False)
+
+
+def flush_state() -> None:
+    """Writes any pending state changes to disk now."""
+    global _STATE_CACHE, _STATE_CACHE_KEY, _DIRTY_PATH, _PENDING_UPDATES, _FULL_WRITE
+    with _STATE_LOCK:
+        path, _DIRTY_PATH = _DIRTY_PATH, None
+        if path is None:
+            return
+        updates, full = _PENDING_UPDATES, _FULL_WRITE
+        _PENDING_UPDATES, _FULL_WRITE = {}, False
+        try:
+            if full or not _log_extends(path):
+                _write_snapshot(path, _STATE_CACHE)
+            else:
+                _append_log_bytes(_log_file(path), b"".join(
+                    _dump_record({"op": "update_job", "id": jid, "fields": fields})
+                    for jid, fields in updates.items()
+                ))
+            _STATE_CACHE_KEY = _state_file_key() if path == STATE_FILE else None
+        except Exception as e:
+            print(f"Warning: Failed to write state to {path}: {e}")
+            _STATE_CACHE = _STATE_CACHE_KEY = None
+
+
+def _writer_loop():
+    while True:
+        _DIRTY.wait()
+        time.sleep(STATE_WRITE_DELAY)
+        _DIRTY.clear()
+        flush_state()
+
+
+def _cached_state_no_lock() -> Optional[Dict[str, Any]]:
+    """
+    Internal helper: assumes caller holds _STATE_LOCK (either side).
+    Returns the cached state if it is current, without touching globals or disk.
+    """
+    if _DIRTY_PATH is not None:
+        # Unwritten changes are newer than anything on disk
+        return _STATE_CACHE if _DIRTY_PATH == STATE_FILE else None
+    if _STATE_CACHE is None:
+        return None
+    try:
+        key = _state_file_key()
+    except OSError:
+        return None
+    return _STATE_CACHE if key == _STATE_CACHE_KEY else None
+
+
+def _read_state(view):
+    """
+    Returns view(state) computed under the shared lock. Only when the cache has to be
+    (re)loaded from disk does it fall back to the exclusive lock.
+    """
+    with _STATE_LOCK.read():
+        state = _cached_state_no_lock()
+        if state is not None:
+            return view(state)
+    with _STATE_LOCK:
+        return view(_load_state_no_lock())
+
+
 def _load_state_no_lock() -> Dict[str, Any]:
     """
     Internal helper: assumes caller already holds _STATE_LOCK.
+    Returns the cached state itself; callers that hand it out must copy.
     """
-    if not STATE_FILE.exists():
+    global _STATE_CACHE, _STATE_CACHE_KEY
+    state = _cached_state_no_lock()
+    if state is not None:
+        return state
+    if _DIRTY_PATH is not None:
+        flush_state()
+
+    try:
+        key = _state_file_key()
+    except FileNotFoundError:
         state = _default_state()
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        _write_state_no_lock(state)
         return state
 
-    raw = STATE_FILE.read_text(encoding="utf-8", errors="replace").strip()
+    raw = STATE_FILE.read_bytes().strip()
     if not raw:
         state = _default_state()
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        _write_state_no_lock(state)
         return state
 
     try:
-        return json.loads(raw)
-    except JSONDecodeError:
+        state = _load_state_bytes(raw)
+    except (JSONDecodeError, UnicodeDecodeError):
         # Backup corrupt file and reset
         backup = STATE_FILE.with_name("state.json.corrupt")
         try:
@@ -66,24 +367,31 @@ def _load_state_no_lock() -> Dict[str, Any]:
         except Exception:
             pass
         state = _default_state()
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        _write_state_no_lock(state)
         return state
 
+    _replay_log(state, STATE_FILE, key[1])
+    _STATE_CACHE, _STATE_CACHE_KEY = state, key
+    return state
+
 
 def load_state() -> Dict[str, Any]:
-    with _STATE_LOCK:
-        return _load_state_no_lock()
+    return _read_state(copy.deepcopy)
 
 
 def save_state(state: Dict[str, Any]) -> None:
+    global _STATE_CACHE, _DIRTY_PATH, _PENDING_UPDATES, _FULL_WRITE
     with _STATE_LOCK:
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        _write_snapshot(STATE_FILE, state)
+        # The caller keeps its dict, so don't adopt it as the cache; it also
+        # supersedes any changes still waiting to be written.
+        _STATE_CACHE = None
+        _DIRTY_PATH = None
+        _PENDING_UPDATES, _FULL_WRITE = {}, False
 
 
 def get_settings() -> Dict[str, Any]:
-    with _STATE_LOCK:
-        state = _load_state_no_lock()
-        return state.get("settings", {})
+    return _read_state(lambda state: dict(state.get("settings", {})))
 
 
 def update_settings(updates: dict = None, **kwargs) -> None:
@@ -94,41 +402,61 @@ def update_settings(updates: dict = None, **kwargs) -> None:
             state["settings"].update(updates)
         if kwargs:
             state["settings"].update(kwargs)
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        _queue_write_no_lock(state)
 
 
 def get_performance_metrics() -> Dict[str, Any]:
-    with _STATE_LOCK:
-        state = _load_state_no_lock()
+    def view(state):
         # Fallback to defaults if missing in older state files
-        metrics = state.get("performance_metrics", {})
-        defaults = _default_state()["performance_metrics"]
-        for k, v in defaults.items():
-            metrics.setdefault(k, v)
+        metrics = dict(_default_state()["performance_metrics"])
+        metrics.update(state.get("performance_metrics", {}))
+        metrics.update(_PERF_PENDING)
         return metrics
+    return _read_state(view)
 
 
 def update_performance_metrics(**updates) -> None:
+    """
+    Records new metric values. They are visible to get_performance_metrics() right away
+    but only persisted every PERF_FLUSH_INTERVAL seconds (and at exit), so a burst of
+    short jobs doesn't rewrite state.json once per job.
+    """
+    with _STATE_LOCK:
+        _PERF_PENDING.update(updates)
+        if time.monotonic() - _PERF_LAST_FLUSH >= PERF_FLUSH_INTERVAL:
+            flush_performance_metrics()
+
+
+def flush_performance_metrics() -> None:
+    """Writes any pending metric updates to state.json."""
+    global _PERF_LAST_FLUSH
     with _STATE_LOCK:
+        _PERF_LAST_FLUSH = time.monotonic()
+        if not _PERF_PENDING:
+            return
         state = _load_state_no_lock()
         metrics = state.setdefault("performance_metrics", {})
-        metrics.update(updates)
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        metrics.update(_PERF_PENDING)
+        _PERF_PENDING.clear()
+        _queue_write_no_lock(state)
+
 
 
 def get_jobs() -> Dict[str, Job]:
-    with _STATE_LOCK:
-        state = _load_state_no_lock()
+    def view(state):
         raw = state.get("jobs", {})
         # Safety: only pass keys that exist in the current Job dataclass
-        import dataclasses
-        job_fields = {f.name for f in dataclasses.fields(Job)}
-
         jobs = {}
         for jid, jdata in raw.items():
-            filtered = {k: v for k, v in jdata.items() if k in job_fields}
+            filtered = {k: v for k, v in jdata.items() if k in JOB_FIELDS}
             jobs[jid] = Job(**filtered)
         return jobs
+    return _read_state(view)
+
+
+def get_job_status(job_id: str) -> Optional[str]:
+    """Current status of a job (None if it isn't in state), without building Job objects."""
+    return _read_state(lambda state: (state.get("jobs", {}).get(job_id) or {}).get("status"))
 
 
 def put_job(job: Job) -> None:
@@ -136,16 +464,19 @@ def put_job(job: Job) -> None:
         state = _load_state_no_lock()
         state.setdefault("jobs", {})
         state["jobs"][job.id] = asdict(job)
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        _queue_write_no_lock(state)
 
 
-def update_job(job_id: str, force_broadcast: bool = False, **updates) -> None:
+def update_job(job_id: str, force_broadcast: bool = False, skip_if_terminal: bool = False, **updates) -> None:
     with _STATE_LOCK:
         state = _load_state_no_lock()
         jobs = state.setdefault("jobs", {})
         j = jobs.get(job_id)
         if not j:
             return
+        # Checked under the lock so a late update can't land after the job finished
+        if skip_if_terminal and j.get("status") in ("done", "failed", "cancelled"):
+            return
 
         # Apply updates with protection
         changed_fields = []
@@ -190,66 +521,17 @@ def update_job(job_id: str, force_broadcast: bool = False, **updates) -> None:
 
         if changed_fields:
             jobs[job_id] = j
-            _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+            _queue_job_update_no_lock(state, job_id, {k: j[k] for k in changed_fields})
 
         # Sync with SQLite DB when status or timestamps change, or when explicitly broadcast
         # Note: force_broadcast=True is used right after enqueue() to register the initial status.
+        sync = None
         if "status" in changed_fields or "started_at" in changed_fields or force_broadcast:
-
-            try:
-                from .db import update_queue_item
-                from .config import XTTS_OUT_DIR
-                import subprocess
-
-                audio_length = 0.0
-                output_file = None
-                new_status = updates.get("status", j.get("status"))
-                if new_status == "done":
-                    # Try to extract the true duration using ffprobe for the synchronized database record
-                    output_file = updates.get("output_mp3", j.get("output_mp3"))
-                    if not output_file:
-                        output_file = updates.get("output_wav", j.get("output_wav"))
-
-                    if output_file:
-                        project_id = updates.get("project_id", j.get("project_id"))
-                        if project_id:
-                            from .config import get_project_audio_dir
-                            pdir = get_project_audio_dir(project_id)
-                        else:
-                            pdir = XTTS_OUT_DIR
-
-                        mp3_path = pdir / output_file
-                        if mp3_path.exists():
-                            try:
-                                result = subprocess.run(
-                                    ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", str(mp3_path)],
-                                    stdout=subprocess.PIPE,
-                                    stderr=subprocess.STDOUT,
-                                    text=True,
-                                    timeout=2
-                                )
-                                audio_length = float(result.stdout.strip())
-                            except Exception as e:
-                                print(f"Warning: Could not get duration for {output_file}: {e}")
-
-                update_queue_item(job_id, new_status, audio_length_seconds=audio_length, force_chapter_id=j.get("chapter_id"), output_file=output_file)
-
-                try:
-                    from .api.ws import broadcast_queue_update
-                    broadcast_queue_update()
-                except ImportError:
-                    pass
-
-            except Exception as e:
-                print(f"Warning: Failed to sync job status to SQLite for {job_id}: {e}")
-
-
-        # Notify listeners
-        for callback in _JOB_LISTENERS:
-            try:
-                callback(job_id, updates)
-            except Exception as e:
-                print(f"Error in job listener: {e}")
+            new_status = updates.get("status", j.get("status"))
+            output_file = None
+            if new_status == "done":
+                output_file = updates.get("output_mp3", j.get("output_mp3")) or updates.get("output_wav", j.get("output_wav"))
+            sync = (new_status, output_file, updates.get("project_id", j.get("project_id")), j.get("chapter_id"))
 
         # PRUNING: If job is done/failed/cancelled, we can remove it from state.json
         # because the historical record is now in SQLite's processing_queue table.
@@ -258,6 +540,56 @@ def update_job(job_id: str, force_broadcast: bool = False, **updates) -> None:
             # Or we can just prune it now. Let's do a 'soft' prune by calling a dedicated function.
             prune_completed_jobs()
 
+        listeners = _JOB_LISTENERS
+
+        if sync:
+            ticket = next(_SYNC_TICKETS)
+
+    if sync:
+        # Waiting for an earlier sync (ffprobe, SQLite) happens here, not under the state lock
+        _sync_in_turn(ticket, job_id, sync)
+
+    # Notify listeners (as registered when the change was made) without holding the state lock
+    for callback in listeners:
+        try:
+            callback(job_id, updates)
+        except Exception as e:
+            print(f"Error in job listener: {e}")
+
+
+def _sync_in_turn(ticket: int, job_id: str, sync: tuple) -> None:
+    global _sync_now_serving
+    with _SYNC_TURN:
+        _SYNC_TURN.wait_for(lambda: _sync_now_serving == ticket)
+    try:
+        _sync_job_to_db(job_id, *sync)
+    finally:
+        with _SYNC_TURN:
+            _sync_now_serving += 1
+            _SYNC_TURN.notify_all()
+
+
+def _sync_job_to_db(job_id: str, status: Optional[str], output_file: Optional[str],
+                    project_id: Optional[str], chapter_id: Optional[str]) -> None:
+    try:
+        audio_length = 0.0
+        if output_file:
+            pdir = get_project_audio_dir(project_id) if project_id else XTTS_OUT_DIR
+            # Cached by mtime/size, so re-syncing an unchanged output doesn't re-probe it
+            audio_length = get_audio_duration(pdir / output_file, timeout=2)
+
+        update_queue_item(job_id, status, audio_length_seconds=audio_length, force_chapter_id=chapter_id, output_file=output_file)
+
+        try:
+            # Imported here: app.api pulls in the routers, which import this module
+            from .api.ws import broadcast_queue_update
+            broadcast_queue_update()
+        except ImportError:
+            pass
+
+    except Exception as e:
+        print(f"Warning: Failed to sync job status to SQLite for {job_id}: {e}")
+
 
 def prune_completed_jobs() -> None:
     """
@@ -281,7 +613,7 @@ def prune_completed_jobs() -> None:
         if to_prune:
             for jid in to_prune:
                 del jobs[jid]
-            _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+            _queue_write_no_lock(state)
             print(f"DEBUG: Pruned {len(to_prune)} terminal jobs from state.json")
 
 
@@ -292,14 +624,14 @@ def delete_jobs(job_ids: list[str]) -> None:
         for jid in job_ids:
             if jid in jobs:
                 del jobs[jid]
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        _queue_write_no_lock(state)
 
 
 def clear_all_jobs() -> None:
     with _STATE_LOCK:
         state = _load_state_no_lock()
         state["jobs"] = {}
-        _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+        _queue_write_no_lock(state)
 
 def purge_jobs_for_chapter(chapter_id: str) -> None:
     """Removes all existing jobs for a specific chapter from the state."""
@@ -310,5 +642,11 @@ def purge_jobs_for_chapter(chapter_id: str) -> None:
         if to_delete:
             for jid in to_delete:
                 del jobs[jid]
-            _atomic_write_text(STATE_FILE, json.dumps(state, indent=2))
+            _queue_write_no_lock(state)
             print(f"DEBUG: Purged {len(to_delete)} stale jobs for chapter {chapter_id}")
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    flush_performance_metrics()
+    flush_state()
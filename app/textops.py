@@ -40,6 +40,8 @@ TEXT PROCESSING PIPELINE - ORDER OF OPERATIONS
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 from .config import SAFE_SPLIT_TARGET, SENT_CHAR_LIMIT, BASELINE_XTTS_CPS
@@ -50,7 +52,66 @@ from .config import SAFE_SPLIT_TARGET, SENT_CHAR_LIMIT, BASELINE_XTTS_CPS
 # merges short sentences with ";" which naturally becomes a pause in the audio.
 
 CHAPTER_RE = re.compile(r"^(Chapter\s+(\d+)\s*:\s*.+)$", re.MULTILINE)
-SENT_SPLIT_RE = re.compile(r'(.+?(?:[.!?]["\'”’]*(?=\s|$)|\n+))(\s*)', re.DOTALL)
+# A sentence runs up to the first [.!?] (plus closing quotes) followed by whitespace/end, or a
+# newline run. Equivalent to r'(.+?(?:TERMINATOR))(\s*)', but the body consumes whole runs of
+# non-terminating text possessively instead of retrying the terminator after every character.
+SENT_SPLIT_RE = re.compile(
+    r'(.(?:[^.!?\n]+|[.!?](?!["\'”’]*(?:\s|$)))*+(?:[.!?]["\'”’]*(?=\s|$)|\n+))(\s*)',
+    re.DOTALL,
+)
+
+def _sentence_matches(text: str):
+    """
+    SENT_SPLIT_RE matches over text, back to back from the start.
+    Matches are contiguous, and once one fails no later position can match: the rest
+    of the text holds no terminator or newline. So stop there rather than letting
+    finditer retry the pattern at every remaining character, which is quadratic in
+    the length of an unterminated tail.
+    """
+    match = SENT_SPLIT_RE.match
+    pos = 0
+    while (m := match(text, pos)) is not None:
+        yield m
+        pos = m.end()
+
+# Brackets, braces, parentheses, and angle brackets are never spoken
+_UNSPOKEN_TABLE = str.maketrans('', '', '[]{}()<>')
+# clean_text_for_tts: the bracket strip plus quote normalization in one table
+_TTS_CHAR_TABLE = str.maketrans({**{c: None for c in '[]{}()<>“”"'}, '‘': "'", '’': "'"})
+# Dashes become commas and ellipsis characters periods, for pacing
+_PACING_TABLE = str.maketrans({'—': ', ', '…': '. '})
+
+_NL3_RE = re.compile(r'\n{3,}')
+_NL2_RE = re.compile(r'\n{2,}')
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\s\-:]")
+_ACRONYM_RE = re.compile(r'\b(?:[A-Za-z]\.){2,}')
+_FRACTION_RE = re.compile(r'(\d+)/(\d+)')
+_SPACE_AFTER_PUNCT_RE = re.compile(r'([.!?])(?=[^ \s.!?\'"])')
+_MULTI_SPACE_RE = re.compile(r' +')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r' +([,;:])')
+_PUNCT_DOT_RE = re.compile(r'([!?])\.+')
+_DUP_PUNCT_RE = re.compile(r'([!?])\1+')
+_HAS_WORD_RE = re.compile(r'\w')
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F\n]+')
+_SPACE_RUN_RE = re.compile(r' {2,}')
+_TERMINAL_RE = re.compile(r'[.!?]["\')\]\s]*$')
+
+
+# Anything one of the clean_text_for_tts passes would rewrite, for printable-ASCII text
+_NEEDS_CLEAN_RE = re.compile(
+    r'[\[\]{}()<>"]'                    # unspoken brackets, double quotes
+    r'|^[ .!?,]|\s$'                    # leading punctuation / edge spaces
+    r"|\.\.\.|\.' |'\."                 # ellipses, quote/period artifacts
+    r'|\.,|,\.|\.;|\. :'                # mixed punctuation
+    r'|  | [,;:]'                       # repeated spaces, space before punctuation
+    r'|\b(?:[A-Za-z]\.){2,}|\d/\d'      # acronyms, fractions
+    r'|[.!?][^ .!?\'"]|[!?]\.|!!|\?\?'  # missing space after, redundant punctuation
+    r"|[.!?]'* "                        # a second sentence (consolidation may merge it)
+)
+
+def _acronym_to_spaces(m: re.Match) -> str:
+    return m.group(0).replace('.', ' ')
+
 
 def normalize_newlines(text: str) -> str:
     """
@@ -65,10 +126,10 @@ def normalize_newlines(text: str) -> str:
     text = text.replace('\r\n', '\n').replace('\r', '\n')
 
     # First, handle 3 or more newlines as a deliberate pause
-    text = re.sub(r'\n{3,}', ';\n', text)
+    text = _NL3_RE.sub(';\n', text)
 
     # Then ensure at least double newlines are preserved for paragraphs
-    text = re.sub(r'\n{2,}', '\n\n', text)
+    text = _NL2_RE.sub('\n\n', text)
 
     return text.strip()
 
@@ -77,24 +138,52 @@ def preprocess_text(text: str) -> str:
     if not text:
         return ""
     # Strip brackets, braces, parentheses, and angle brackets
-    for char in '[]{}()<>':
-        text = text.replace(char, "")
-    return text
+    return text.translate(_UNSPOKEN_TABLE)
+
+def _chapter_matches(text: str) -> list:
+    """
+    CHAPTER_RE.finditer(text) as a list. Headings are a few dozen lines in a whole
+    book, so str.find jumps between "Chapter" occurrences and the regex only runs at
+    the ones that start a line, instead of being tried at every line of the text.
+    """
+    matches = []
+    find, match = text.find, CHAPTER_RE.match
+    pos = 0
+    while (pos := find("Chapter", pos)) != -1:
+        if pos == 0 or text[pos - 1] == "\n":
+            m = match(text, pos)
+            if m:
+                matches.append(m)
+                pos = m.end()
+                continue
+        pos += 1
+    return matches
 
 def split_by_chapter_markers(full_text: str) -> List[Tuple[int, str, str]]:
-    full_text = preprocess_text(full_text)
-    matches = list(CHAPTER_RE.finditer(full_text))
-    if not matches:
-        return []
-    spans = []
-    for i, m in enumerate(matches):
-        start = m.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(full_text)
-        heading = m.group(1).strip()
-        chap_num = int(m.group(2))
-        body = full_text[start:end].strip()
-        spans.append((chap_num, heading, body))
-    return spans
+    # Brackets can decide whether a line reads as a heading, so they are stripped before
+    # matching; text without any (the usual case) is matched as-is, without the copy.
+    if any(c in full_text for c in "[]{}()<>"):
+        full_text = preprocess_text(full_text)
+    matches = _chapter_matches(full_text)
+    ends = [m.start() for m in matches[1:]] + [len(full_text)]
+    return [
+        (int(m.group(2)), m.group(1).strip(), full_text[m.start():end].strip())
+        for m, end in zip(matches, ends)
+    ]
+
+def _last_sentence_end(text: str, start: int, end: int) -> int:
+    """
+    Index just past the last '.', '!' or '?' in text[start:end] that is followed by
+    whitespace or sits at `end`, or -1. Scans backwards from `end`.
+    """
+    limit = end
+    while True:
+        i = max(text.rfind('.', start, limit), text.rfind('!', start, limit), text.rfind('?', start, limit))
+        if i == -1:
+            return -1
+        if i + 1 == end or text[i + 1].isspace():
+            return i + 1
+        limit = i
 
 def split_into_parts(text: str, max_chars: int = 30000, start_index: int = 1) -> List[Tuple[int, str, str]]:
     text = preprocess_text(text)
@@ -104,51 +193,55 @@ def split_into_parts(text: str, max_chars: int = 30000, start_index: int = 1) ->
     parts = []
     part_num = start_index
 
-    remaining_text = text.strip()
+    # Walk an offset through the text and search each window in place, so nothing
+    # but the parts themselves is ever copied
+    text = text.strip()
+    n = len(text)
+    pos = 0
 
-    while remaining_text:
-        if len(remaining_text) <= max_chars:
-            parts.append((part_num, f"Part {part_num}", remaining_text))
+    while pos < n:
+        if n - pos <= max_chars:
+            parts.append((part_num, f"Part {part_num}", text[pos:]))
             break
 
-        split_point = -1
-        chunk = remaining_text[:max_chars]
-        p_break = chunk.rfind("\n\n")
-        if p_break > max_chars * 0.7:
+        window_end = pos + max_chars
+        # rfind already scans backwards from the end; the start bounds only stop a miss
+        # from walking the part of the window whose hits would be rejected anyway
+        p_break = text.rfind("\n\n", pos + int(max_chars * 0.7) + 1, window_end)
+        if p_break != -1:
             split_point = p_break + 2
         else:
-            nl_break = chunk.rfind("\n")
-            if nl_break > max_chars * 0.8:
+            nl_break = text.rfind("\n", pos + int(max_chars * 0.8) + 1, window_end)
+            if nl_break != -1:
                 split_point = nl_break + 1
             else:
-                search_start = int(max_chars * 0.8)
-                sent_match = None
-                for m in re.finditer(r'[.!?](\s+|$)', chunk[search_start:]):
-                    sent_match = m
-
-                if sent_match:
-                    split_point = search_start + sent_match.end()
+                sent_end = _last_sentence_end(text, pos + int(max_chars * 0.8), window_end)
+                if sent_end != -1:
+                    split_point = sent_end
                 else:
-                    space_break = chunk.rfind(" ")
-                    if space_break > 0:
+                    space_break = text.rfind(" ", pos, window_end)
+                    if space_break > pos:
                         split_point = space_break + 1
                     else:
-                        split_point = max_chars
+                        split_point = window_end
 
-        parts.append((part_num, f"Part {part_num}", remaining_text[:split_point].strip()))
-        remaining_text = remaining_text[split_point:].strip()
+        parts.append((part_num, f"Part {part_num}", text[pos:split_point].strip()))
+        pos = split_point
+        while pos < n and text[pos].isspace():
+            pos += 1
         part_num += 1
 
     return parts
 
+@lru_cache(maxsize=2048)
 def safe_filename(s: str, max_len: int = 80) -> str:
     """Removes illegal filename characters but preserves spaces for readability."""
-    s = re.sub(r"[^\w\s\-:]", "", s).strip()
+    s = _UNSAFE_FILENAME_RE.sub("", s).strip()
     return s[:max_len]
 
 def write_chapters_to_folder(chapters, out_dir: Path, prefix: str = "chapter", include_heading: bool = True) -> List[Path]:
     out_dir.mkdir(parents=True, exist_ok=True)
-    written = []
+    files = []
     for chap_num, heading, body in chapters:
         if include_heading:
             # Traditional chapter naming: [prefix]_[num]_[heading].txt
@@ -158,9 +251,24 @@ def write_chapters_to_folder(chapters, out_dir: Path, prefix: str = "chapter", i
             # Using 3 digits as requested (001)
             fname = out_dir / f"{prefix}_{chap_num:03}.txt"
 
-        fname.write_text(body + "\n", encoding="utf-8")
-        written.append(fname)
-    return written
+        files.append((fname, body))
+
+    def write(item):
+        fname, body = item
+        # Binary mode: no text-layer encoder, and no body + "\n" copy of the whole chapter
+        with open(fname, "wb") as f:
+            f.write(body.encode("utf-8"))
+            f.write(b"\n")
+
+    # Each file is mostly open/truncate/close syscalls, which release the GIL, so a
+    # book's worth of chapters is written from a few threads instead of one by one
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+            list(pool.map(write, files))
+    else:
+        for item in files:
+            write(item)
+    return [fname for fname, _ in files]
 
 def split_sentences(text: str, preserve_gap: bool = False):
     """
@@ -168,7 +276,7 @@ def split_sentences(text: str, preserve_gap: bool = False):
     If preserve_gap is True, the sentence will include its trailing whitespace/newlines.
     """
     last_end = 0
-    for m in SENT_SPLIT_RE.finditer(text):
+    for m in _sentence_matches(text):
         if preserve_gap:
             # Full match includes the trailing space group
             s = m.group(0)
@@ -188,6 +296,23 @@ def split_sentences(text: str, preserve_gap: bool = False):
             remainder = remainder.strip()
         yield remainder, last_end, last_end + len(remainder)
 
+def _sentence_texts(text: str) -> List[str]:
+    """
+    The sentences split_sentences(text) yields, without offsets. For callers that only
+    need the strings.
+    """
+    out = []
+    consumed = 0
+    for m in _sentence_matches(text):
+        sent = m.group(1).strip(" \t\r")
+        if sent:
+            out.append(sent)
+        consumed = m.end()
+    remainder = text[consumed:].strip()
+    if remainder:
+        out.append(remainder)
+    return out
+
 def safe_split_long_sentences(text: str, target: int = SAFE_SPLIT_TARGET) -> str:
     def split_one(s: str) -> List[str]:
         if len(s) <= target:
@@ -226,32 +351,44 @@ def safe_split_long_sentences(text: str, target: int = SAFE_SPLIT_TARGET) -> str
             i = j
         return out
 
-    lines = text.split('\n')
     processed_lines = []
-    for line in lines:
+    for line in text.split('\n'):
+        # Blank lines are dropped rather than joined and collapsed with a regex afterwards
         if not line.strip():
-            processed_lines.append("")
             continue
 
         pieces = []
-        for s, _, _ in split_sentences(line):
+        for s in _sentence_texts(line):
             pieces.extend(split_one(s) if len(s) > target else [s])
         processed_lines.append(" ".join(pieces))
 
-    result = "\n".join(processed_lines)
-    # Final newline normalization
-    result = re.sub(r'\n{2,}', '\n', result)
-    return result.strip()
+    return "\n".join(processed_lines).strip()
 
 
 def find_long_sentences(text: str, limit: int = SENT_CHAR_LIMIT):
+    if len(text) <= limit:
+        # No sentence can be longer than the text itself
+        return []
     text = preprocess_text(text)
+    # Same sentences and numbering as split_sentences(text), but a sentence is only
+    # materialized and stripped when its raw span is already longer than the limit.
+    # (Every match yields there: a sentence ends in a terminator, quote or newline,
+    # so stripping " \t\r" never empties it.)
     hits = []
     idx = 0
-    for s, start, end in split_sentences(text):
+    last_end = 0
+    for m in _sentence_matches(text):
         idx += 1
-        if len(s) > limit:
-            hits.append((idx, len(s), start, end, s))
+        start, end = m.span(1)
+        if end - start > limit:
+            s = m.group(1).strip(" \t\r")
+            if len(s) > limit:
+                hits.append((idx, len(s), start, start + len(s), s))
+        last_end = m.end()
+
+    remainder = text[last_end:].strip()
+    if len(remainder) > limit:
+        hits.append((idx + 1, len(remainder), last_end, last_end + len(remainder), remainder))
     return hits
 
 # --- ORDER OF OPERATIONS FOR CREATING SAFE TEXT ---
@@ -274,11 +411,20 @@ def find_long_sentences(text: str, limit: int = SENT_CHAR_LIMIT):
 #     Merge short sentences (<= 2 words) into neighbors using
 #     forward-favored semicolons.
 
+def _is_tts_clean(text: str) -> bool:
+    """
+    True if clean_text_for_tts would return text unchanged: a single sentence of printable
+    ASCII with nothing for any cleaning pass to rewrite.
+    """
+    return text.isascii() and text.isprintable() and not _NEEDS_CLEAN_RE.search(text)
+
 def clean_text_for_tts(text: str) -> str:
     """Normalize punctuation and chars to avoid TTS speech artifacts,
     preserving newlines."""
     if not text:
         return ""
+    if _is_tts_clean(text):
+        return text
 
     # Split into lines to preserve newlines during cleaning
     lines = text.split('\n')
@@ -289,44 +435,34 @@ def clean_text_for_tts(text: str) -> str:
             cleaned_lines.append("")
             continue
 
-        ln = preprocess_text(line)
-
-        # Handle smart quotes and then strip all quotes
-        # (standard and normalized)
-        smart = [("“", ''), ("”", ''), ("‘", "'"), ("’", "'")]
-        for old, new in smart:
-            ln = ln.replace(old, new)
-        ln = ln.replace('"', '')
+        # Strip unspoken brackets, drop double quotes (smart and standard)
+        # and normalize smart single quotes to ('), all in one pass
+        ln = line.translate(_TTS_CHAR_TABLE)
 
         # Normalize acronyms/initials: A.B. if 2 or more. A. alone is a period.
-        pattern = r'\b(?:[A-Za-z]\.){2,}'
-        ln = re.sub(pattern, lambda m: m.group(0).replace('.', ' '), ln)
+        ln = _ACRONYM_RE.sub(_acronym_to_spaces, ln)
 
         # Normalize fractions (444/7000 -> 444 out of 7000)
-        ln = re.sub(r'(\d+)/(\d+)', r'\1 out of \2', ln)
+        ln = _FRACTION_RE.sub(r'\1 out of \2', ln)
 
         # Strip leading dots/ellipses/punctuation
         ln = ln.lstrip(" .…!?,")
         # Handle dashes and ellipses. Use commas for ellipses to prevent
         # breaks.
-        ln = ln.replace("—", ", ").replace("…", ". ").replace("...", ". ")
+        ln = ln.translate(_PACING_TABLE).replace("...", ". ")
 
-        # Common redundant punctuation artifacts
+        # Common redundant punctuation artifacts. (Double quotes are already
+        # gone, so only the single-quote variants can occur.)
         ln = ln.replace(".' .", ". ").replace(".' ", ". ").replace("'.", ".'")
-        ln = (
-            ln.replace('".',  '."')
-            .replace('?"', '"?')
-            .replace('!"', '"!')
-        )
 
         # Normalize spaces after punctuation (if missing)
-        ln = re.sub(r'([.!?])(?=[^ \s.!?\'"])', r'\1 ', ln)
+        ln = _SPACE_AFTER_PUNCT_RE.sub(r'\1 ', ln)
         # Collapse multiple spaces
-        ln = re.sub(r' +', ' ', ln)
+        ln = _MULTI_SPACE_RE.sub(' ', ln)
         # Remove spaces before punctuation
-        ln = re.sub(r' +([,;:])', r'\1', ln)
+        ln = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', ln)
         # Remove redundant punctuation
-        ln = re.sub(r'([!?])\.+', r'\1', ln)
+        ln = _PUNCT_DOT_RE.sub(r'\1', ln)
         # Fix ., -> , and ,. -> . and .; -> ; etc
         ln = (
             ln.replace(".,", ",")
@@ -336,7 +472,7 @@ def clean_text_for_tts(text: str) -> str:
         )
         # Collapse multiple identical punctuations like !! -> ! or ?? -> ?
         # (preserving ...)
-        ln = re.sub(r'([!?])\1+', r'\1', ln)
+        ln = _DUP_PUNCT_RE.sub(r'\1', ln)
 
         cleaned_lines.append(ln)
 
@@ -346,9 +482,23 @@ def clean_text_for_tts(text: str) -> str:
     result = consolidate_single_word_sentences(result)
 
     # Finally normalize to collapse any resulting empty lines beyond 1
-    result = re.sub(r'\n{2,}', '\n', result)
+    result = _NL2_RE.sub('\n', result)
     return result.strip()
 
+def _capped_word_count(text: str, cap: int) -> int:
+    """min(cap, number of whitespace-separated tokens in text containing a word character)."""
+    head = text.split(None, cap)
+    count = sum(1 for w in head[:cap] if _HAS_WORD_RE.search(w))
+    if count == cap or len(head) <= cap:
+        return count
+    # A wordless token among the first few; count the rest until the cap is reached
+    for w in head[cap].split():
+        if _HAS_WORD_RE.search(w):
+            count += 1
+            if count == cap:
+                break
+    return count
+
 def consolidate_single_word_sentences(text: str) -> str:
     """
     TTS engines (especially XTTS) often fail on short sentences.
@@ -365,90 +515,71 @@ def consolidate_single_word_sentences(text: str) -> str:
     # We want to maintain sentence splitting relative to the whole text
     # but respect where newlines occurred.
 
-    all_sentences_with_meta = []
+    # (text, line_idx) per sentence that has at least one word
+    sentences = []
     for line_idx, line in enumerate(lines):
-        sents = [s.strip() for s, _, _ in split_sentences(line)]
-        for s in sents:
-            cleaned = s.lstrip(" .…!?,")
-            if re.search(r'\w', cleaned):
-                all_sentences_with_meta.append({
-                    "text": cleaned,
-                    "line_idx": line_idx
-                })
-
-    if len(all_sentences_with_meta) <= 1:
+        for s in _sentence_texts(line):
+            cleaned = s.strip().lstrip(" .…!?,")
+            if _HAS_WORD_RE.search(cleaned):
+                sentences.append((cleaned, line_idx))
+
+    if len(sentences) <= 1:
         return text
 
+    # Words (whitespace-separated tokens with a word character) per sentence, counted once.
+    # A merge only strips trailing punctuation and adds "; ", so it keeps every word of
+    # both sides and the merged count is just the sum. Counts only decide "fewer than 4",
+    # so they are capped at 4: most sentences are settled by their first four tokens.
+    word_counts = [_capped_word_count(t, 4) for t, _ in sentences]
+
     consolidated = []
     i = 0
-    while i < len(all_sentences_with_meta):
-        curr = all_sentences_with_meta[i]
-
-        # Calculate current word count
-        def count_words(t):
-            return len([w for w in t.split() if re.search(r'\w', w)])
-
-        current_text = curr['text']
-        current_line_idx = curr['line_idx']
+    while i < len(sentences):
+        current_text, current_line_idx = sentences[i]
+        words = word_counts[i]
 
         # Greedy merge forward until we hit the safety threshold (4 words)
-        while (count_words(current_text) < 4 and
-               i < len(all_sentences_with_meta) - 1):
+        while words < 4 and i < len(sentences) - 1:
             i += 1
-            next_sent = all_sentences_with_meta[i]
+            next_text, next_line_idx = sentences[i]
+            words += word_counts[i]
             # Use single semicolon for all merges now
-            sep = "; "
-            current_text = (
-                current_text.rstrip(".!?; ") + sep + next_sent['text']
-            )
+            current_text = current_text.rstrip(".!?; ") + "; " + next_text
             # Update line_idx to latest consumed sentence to keep paragraph flow
-            current_line_idx = next_sent['line_idx']
+            current_line_idx = next_line_idx
 
-        consolidated.append({
-            "text": current_text,
-            "line_idx": current_line_idx
-        })
+        consolidated.append((current_text, current_line_idx))
         i += 1
 
+    def join_block(texts):
+        # Append with space unless the previous unit already ends in a pause separator
+        parts = [texts[0]]
+        for prev, t in zip(texts, texts[1:]):
+            if not prev.endswith(("; ", ";; ")):
+                parts.append(" ")
+            parts.append(t)
+        return "".join(parts)
+
     # Reconstruct lines based on line_idx changes
     final_output = []
     current_line = 0
     buffer = []
 
-    for item in consolidated:
-        if item['line_idx'] > current_line:
+    for item_text, item_line_idx in consolidated:
+        if item_line_idx > current_line:
             # Commit the current buffer as a single block
             if buffer:
-                joined = ""
-                for idx, text in enumerate(buffer):
-                    if idx == 0:
-                        joined = text
-                    else:
-                        # Append with space if we didn't add a pause
-                        # separator
-                        has_pause = (
-                            joined.endswith("; ") or joined.endswith(";; ")
-                        )
-                        sep = "" if has_pause else " "
-                        joined += sep + text
-                final_output.append(joined)
+                final_output.append(join_block(buffer))
 
             # Pad with empty lines if there were gaps
-            final_output.extend([""] * (item['line_idx'] - current_line - 1))
-            buffer = [item['text']]
-            current_line = item['line_idx']
+            final_output.extend([""] * (item_line_idx - current_line - 1))
+            buffer = [item_text]
+            current_line = item_line_idx
         else:
-            buffer.append(item['text'])
+            buffer.append(item_text)
 
     if buffer:
-        joined = ""
-        for idx, text in enumerate(buffer):
-            if idx == 0:
-                joined = text
-            else:
-                sep = "" if joined.endswith("; ") or joined.endswith(";; ") else " "
-                joined += sep + text
-        final_output.append(joined)
+        final_output.append(join_block(buffer))
 
     return "\n".join(final_output)
 
@@ -458,6 +589,10 @@ def sanitize_for_xtts(text: str) -> str:
     Advanced sanitization specifically tuned for Coqui XTTS v2.
     It builds on the base cleaning plus specific hallucination prevention.
     """
+    # Single clean, punctuated lines (common after packing) need no work
+    if text and _is_tts_clean(text) and _TERMINAL_RE.search(text):
+        return text
+
     # 1. Perform base TTS cleaning
     # (includes bracket stripping and consolidation)
     text = clean_text_for_tts(text)
@@ -467,15 +602,19 @@ def sanitize_for_xtts(text: str) -> str:
 
     # 2. Remove any remaining non-ASCII characters
     # that might cause hallucinations
-    text = re.sub(r'[^\x00-\x7F\n]+', '', text)
-    # Collapse multiple horizontal spaces and trim
-    text = re.sub(r'[ \t]+', ' ', text).strip()
+    if not text.isascii():
+        text = _NON_ASCII_RE.sub('', text)
+    # Collapse multiple horizontal spaces (tabs are spaces by now) and trim;
+    # single spaces are left alone instead of being rewritten one by one
+    if "  " in text:
+        text = _SPACE_RUN_RE.sub(' ', text)
+    text = text.strip()
     # Normalize multiple newlines to maximum of 1
-    text = re.sub(r'\n{2,}', '\n', text)
+    text = _NL2_RE.sub('\n', text)
 
     # 3. Ensure terminal punctuation
     # (XTTS v2 can fail on short strings without it)
-    if text and not re.search(r'[.!?]["\')\]\s]*$', text):
+    if text and not _TERMINAL_RE.search(text):
         text += "."
 
     return text
@@ -494,33 +633,34 @@ def pack_text_to_limit(
         return ""
 
     # Split into blocks by literal newlines to respect paragraphing
-    raw_lines = text.split('\n')
     packed = []
-    current_chunk = ""
+    # The chunk being built, as its lines plus the joined length ('\n' between lines)
+    chunk_lines = []
+    chunk_len = 0
+
+    def flush():
+        chunk = '\n'.join(chunk_lines)
+        packed.append(chunk.ljust(limit) if pad else chunk)
 
-    for line in raw_lines:
+    for line in text.split('\n'):
         line_content = line.strip()
         # If it's an empty line (paragraph break),
         # we treat it as part of the previous or next chunk
         # But we must ensure it doesn't break the chunking greedy logic.
-        separator = "\n" if current_chunk else ""
-
-        if (current_chunk and (len(current_chunk) + len(separator) +
-                               len(line_content) <= limit)):
-            current_chunk += separator + line_content
-        elif not current_chunk and len(line_content) <= limit:
-            current_chunk = line_content
+        if chunk_len and chunk_len + 1 + len(line_content) <= limit:
+            chunk_lines.append(line_content)
+            chunk_len += 1 + len(line_content)
+        elif not chunk_len and len(line_content) <= limit:
+            chunk_lines = [line_content]
+            chunk_len = len(line_content)
         else:
-            if current_chunk:
-                if pad:
-                    current_chunk = current_chunk.ljust(limit)
-                packed.append(current_chunk)
-            current_chunk = line_content
-
-    if current_chunk:
-        if pad:
-            current_chunk = current_chunk.ljust(limit)
-        packed.append(current_chunk)
+            if chunk_len:
+                flush()
+            chunk_lines = [line_content]
+            chunk_len = len(line_content)
+
+    if chunk_len:
+        flush()
 
     return '\n'.join(packed)
 
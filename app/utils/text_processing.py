@@ -3,6 +3,9 @@ from typing import List, Generator, Tuple
 
 # Sentence splitting regex
 _SENT_SPLIT_RE = re.compile(r"(.+?)(?:(?<=[.!?])\s+|$)", re.DOTALL)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SMART_QUOTES_TABLE = str.maketrans({'“': '"', '”': '"', '‘': "'", '’': "'"})
 
 def split_sentences_with_spans(text: str) -> Generator[Tuple[str, int, int], None, None]:
     for m in _SENT_SPLIT_RE.finditer(text):
@@ -88,13 +91,13 @@ def sanitize_for_xtts(text: str) -> str:
     Handles smart quotes, ellipses, and non-ASCII chars.
     """
     # Convert smart quotes to straight quotes
-    text = text.replace('“', '"').replace('”', '"').replace('‘', "'").replace('’', "'")
+    text = text.translate(_SMART_QUOTES_TABLE)
     # Replace ellipses with a comma for better natural pauses
     text = text.replace('...', ', ')
     # Remove any non-standard characters/emojis
-    text = re.sub(r'[^\x00-\x7F]+', '', text)
+    text = _NON_ASCII_RE.sub('', text)
     # Collapse multiple spaces and trim
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     return text
 
 def pack_text_to_limit(text: str, limit: int = 250) -> str:
@@ -23,13 +23,24 @@ logger = logging.getLogger(__name__)
 app = FastAPI()
 
 # --- Static File Serving ---
-# --- Static File Serving ---
-app.mount("/out/xtts", StaticFiles(directory=str(XTTS_OUT_DIR)), name="out_xtts")
-app.mount("/out/audiobook", StaticFiles(directory=str(AUDIOBOOK_DIR)), name="out_audiobook")
+class MediaFiles(StaticFiles):
+    """StaticFiles for large audio (chapter wavs, m4bs). FileResponse already handles
+    Range requests for seeking; this only streams in bigger reads than its 64 KiB default,
+    so a long book takes far fewer read/send round trips."""
+    chunk_size = 1024 * 1024
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        if isinstance(response, FileResponse):
+            response.chunk_size = self.chunk_size
+        return response
+
+app.mount("/out/xtts", MediaFiles(directory=str(XTTS_OUT_DIR)), name="out_xtts")
+app.mount("/out/audiobook", MediaFiles(directory=str(AUDIOBOOK_DIR)), name="out_audiobook")
 app.mount("/out/voices", StaticFiles(directory=str(VOICES_DIR)), name="out_voices")
 app.mount("/out/samples", StaticFiles(directory=str(SAMPLES_DIR)), name="out_samples")
 app.mount("/out/covers", StaticFiles(directory=str(COVER_DIR)), name="out_covers")
-app.mount("/projects", StaticFiles(directory=str(PROJECTS_DIR)), name="projects")
+app.mount("/projects", MediaFiles(directory=str(PROJECTS_DIR)), name="projects")
 
 # Serve React build if it exists
 if FRONTEND_DIST.exists():
@@ -5,8 +5,6 @@ import sys
 os.environ["PYTHONWARNINGS"] = "ignore"
 os.environ["COQUI_TOS_AGREED"] = "1"
 
-import torch
-import torchaudio
 import argparse
 import warnings
 import json
@@ -26,6 +24,7 @@ def main():
     parser.add_argument("--temperature", type=float, default=0.75, help="Temperature")
     parser.add_argument("--speed", type=float, default=1.0, help="Speaking speed (1.0 = normal)")
     parser.add_argument("--script_json", help="Path to a JSON file containing segments: list of {'text', 'speaker_wav'}")
+    parser.add_argument("--compile", action="store_true", help="torch.compile the GPT and HiFi-GAN decoder (CUDA only; pays off on long runs)")
 
     args = parser.parse_args()
 
@@ -52,6 +51,10 @@ def main():
         for c in chunks:
             script.append({"text": c, "speaker_wav": args.speaker_wav})
 
+    # Torch takes seconds to import; only pay for it once the arguments and script are valid
+    import numpy as np
+    import torch
+
     voice_dir = os.path.expanduser("~/.cache/audiobook-studio/voices")
     os.makedirs(voice_dir, exist_ok=True)
 
@@ -86,6 +89,12 @@ def main():
     # Load model (quietly)
     print("Loading XTTS model...", file=sys.stderr)
     device = "cuda" if torch.cuda.is_available() else "cpu"
+    # The autoregressive GPT pass is memory-bound on GPU; half-precision activations
+    # and TF32 matmuls roughly halve the traffic. Weights and cached latents stay FP32.
+    use_autocast = device == "cuda"
+    if use_autocast:
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
 
     original_stderr = sys.stderr
     try:
@@ -95,6 +104,19 @@ def main():
     finally:
         sys.stderr = original_stderr
 
+    compiled = False
+    if args.compile and device == "cuda":
+        # Shapes change with every sentence (and every decoding step for the GPT),
+        # so compile dynamically rather than capturing graphs per shape
+        try:
+            import torch._dynamo as dynamo
+            dynamo.config.cache_size_limit = 64
+            xtts_model.gpt.gpt = torch.compile(xtts_model.gpt.gpt, dynamic=True)
+            xtts_model.hifigan_decoder = torch.compile(xtts_model.hifigan_decoder, dynamic=True)
+            compiled = True
+        except Exception as e:
+            print(f"Warning: torch.compile unavailable, running eagerly: {e}", file=sys.stderr)
+
     # Pre-load all unique latents
     unique_speakers = list(set(s['speaker_wav'] for s in script))
     speaker_latents = {}
@@ -108,34 +130,65 @@ def main():
     print(f"Synthesizing {len(script)} segments to {args.out_path}...", file=sys.stderr)
     print("[START_SYNTHESIS]", file=sys.stderr, flush=True)
 
+    # The chapter WAV is streamed to disk chunk by chunk rather than held in memory
+    # until the end; it is written next to the output and moved into place once complete
+    part_path = args.out_path + ".part"
+    writer = None
+
     try:
         from tqdm import tqdm
-        all_wav_chunks = []
-        pause_indices = set()  # indices that are already silence tensors from <PAUSE> markers
+        import soundfile as sf
+        chunk_count = 0
+
+        def _emit(wav):
+            nonlocal writer, chunk_count
+            if writer is None:
+                writer = sf.SoundFile(part_path, mode="w", samplerate=SAMPLE_RATE, channels=1,
+                                      format="WAV", subtype="PCM_16")
+            writer.write(np.clip(wav, -1.0, 1.0))
+            chunk_count += 1
+
+        # Chunks are kept as float32 numpy arrays (what XTTS returns) and written out as
+        # 16-bit PCM, which is plenty for speech at half the size of float WAVs.
+        # Silence is only ever written out, never modified, so one array per duration is shared
+        silences = {}
+
+        def _silence(ms):
+            if ms not in silences:
+                silences[ms] = np.zeros(int(SAMPLE_RATE * ms / 1000), dtype=np.float32)
+            return silences[ms]
 
         def _synthesize_one(text_to_speak, latent_pair, fallback_sw):
             """Synthesize a single text string, returning the raw wav numpy array."""
-            if latent_pair:
-                gpt_cond, spk_emb = latent_pair
-                out_dict = xtts_model.inference(
-                    text=text_to_speak,
-                    language=args.language,
-                    gpt_cond_latent=gpt_cond,
-                    speaker_embedding=spk_emb,
-                    temperature=args.temperature,
-                    speed=args.speed,
-                    repetition_penalty=args.repetition_penalty
-                )
-                return out_dict['wav']
-            else:
-                return tts.synthesizer.tts(
-                    text=text_to_speak,
-                    speaker_wav=fallback_sw,
-                    language_name=args.language,
-                    speed=args.speed,
-                    repetition_penalty=args.repetition_penalty,
-                    temperature=args.temperature
-                )
+            with torch.inference_mode(), torch.autocast(device_type=device, dtype=torch.float16, enabled=use_autocast):
+                if latent_pair:
+                    gpt_cond, spk_emb = latent_pair
+                    out_dict = xtts_model.inference(
+                        text=text_to_speak,
+                        language=args.language,
+                        gpt_cond_latent=gpt_cond,
+                        speaker_embedding=spk_emb,
+                        temperature=args.temperature,
+                        speed=args.speed,
+                        repetition_penalty=args.repetition_penalty
+                    )
+                    return out_dict['wav']
+                else:
+                    return tts.synthesizer.tts(
+                        text=text_to_speak,
+                        speaker_wav=fallback_sw,
+                        language_name=args.language,
+                        speed=args.speed,
+                        repetition_penalty=args.repetition_penalty,
+                        temperature=args.temperature
+                    )
+
+        if compiled:
+            # Trigger compilation up front so it doesn't stall the first segment's progress
+            warmup_latents = next((lat for lat in speaker_latents.values() if lat), None)
+            if warmup_latents:
+                print("Compiling XTTS model...", file=sys.stderr)
+                _synthesize_one("Warming up the model.", warmup_latents, None)
 
         with tqdm(total=len(script), unit="seg", desc="Synthesizing", file=sys.stderr) as pbar:
             for i, segment in enumerate(script):
@@ -175,26 +228,24 @@ def main():
                                     sub_text = sub_part.strip()
                                     if sub_text and any(c.isalnum() for c in sub_text):
                                         wav_chunk = _synthesize_one(sub_text, latents, sw)
-                                        chunk_tensor = torch.FloatTensor(wav_chunk)
-                                        all_wav_chunks.append(chunk_tensor)
-                                        segment_wav_chunks.append(chunk_tensor)
+                                        chunk_wav = np.asarray(wav_chunk, dtype=np.float32)
+                                        _emit(chunk_wav)
+                                        segment_wav_chunks.append(chunk_wav)
                                     if sp_idx < len(sub_parts) - 1:
-                                        pause_samples = int(SAMPLE_RATE * PAUSE_CHAR_MS / 1000)
-                                        silence = torch.zeros(pause_samples)
-                                        all_wav_chunks.append(silence)
+                                        silence = _silence(PAUSE_CHAR_MS)
+                                        _emit(silence)
                                         segment_wav_chunks.append(silence)
-                                        pause_indices.add(len(all_wav_chunks) - 1)
                             else:
                                 # Combined chunk is safer for the model
                                 wav_chunk = _synthesize_one(sentence, latents, sw)
-                                chunk_tensor = torch.FloatTensor(wav_chunk)
-                                all_wav_chunks.append(chunk_tensor)
-                                segment_wav_chunks.append(chunk_tensor)
+                                chunk_wav = np.asarray(wav_chunk, dtype=np.float32)
+                                _emit(chunk_wav)
+                                segment_wav_chunks.append(chunk_wav)
                         else:
                             wav_chunk = _synthesize_one(sentence, latents, sw)
-                            chunk_tensor = torch.FloatTensor(wav_chunk)
-                            all_wav_chunks.append(chunk_tensor)
-                            segment_wav_chunks.append(chunk_tensor)
+                            chunk_wav = np.asarray(wav_chunk, dtype=np.float32)
+                            _emit(chunk_wav)
+                            segment_wav_chunks.append(chunk_wav)
 
                         # Add sentence or paragraph pause
                         is_last_sentence = (s_idx == len(sentences) - 1)
@@ -208,27 +259,29 @@ def main():
                             pause_ms = PARAGRAPH_PAUSE_MS
 
                         if pause_ms > 0:
-                            pause_samples = int(SAMPLE_RATE * pause_ms / 1000)
-                            silence = torch.zeros(pause_samples)
-                            all_wav_chunks.append(silence)
+                            silence = _silence(pause_ms)
+                            _emit(silence)
                             segment_wav_chunks.append(silence)
-                            pause_indices.add(len(all_wav_chunks) - 1)
 
                 # Save this segment individually if requested (for Performance tab playback)
                 if 'save_path' in segment and segment_wav_chunks:
-                    seg_wav = torch.cat(segment_wav_chunks, dim=0)
-                    torchaudio.save(segment['save_path'], seg_wav.unsqueeze(0), SAMPLE_RATE)
+                    seg_wav = np.clip(np.concatenate(segment_wav_chunks), -1.0, 1.0)
+                    sf.write(segment['save_path'], seg_wav, SAMPLE_RATE, subtype="PCM_16")
                     # Signal to parent process that this segment's audio is ready
                     print(f"[SEGMENT_SAVED] {segment['save_path']}", file=sys.stderr)
 
                 pbar.update(1)
 
-        if all_wav_chunks:
-            final_wav = torch.cat(all_wav_chunks, dim=0)
-            torchaudio.save(args.out_path, final_wav.unsqueeze(0), SAMPLE_RATE)
-            print(f"Successfully synthesized {len(all_wav_chunks)} audio chunks.", file=sys.stderr)
+        if writer is not None:
+            writer.close()
+            os.replace(part_path, args.out_path)
+            print(f"Successfully synthesized {chunk_count} audio chunks.", file=sys.stderr)
 
     except Exception as e:
+        if writer is not None:
+            writer.close()
+            if os.path.exists(part_path):
+                os.remove(part_path)
         print(f"\n[CRITICAL ERROR] XTTS failed: {str(e)}", file=sys.stderr)
         import traceback
         traceback.print_exc()
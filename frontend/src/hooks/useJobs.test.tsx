@@ -65,6 +65,38 @@ describe('useJobs', () => {
     expect(result.current.jobs.job1.progress).toBe(0.2);
   });
 
+  it('merges batched jobs_updated frames', async () => {
+    let wsHandler: (data: any) => void = () => {};
+    (useWebSocket as any).mockImplementation((_url: string, handler: any) => {
+      wsHandler = handler;
+      return { connected: true };
+    });
+
+    const mockInitialJobs = [
+      { id: 'job1', status: 'running', progress: 0.1 },
+      { id: 'job2', status: 'queued', progress: 0 },
+    ];
+    (api.fetchJobs as any).mockResolvedValue(mockInitialJobs);
+
+    const { result } = renderHook(() => useJobs());
+
+    await waitFor(() => expect(result.current.loading).toBe(false));
+
+    act(() => {
+      wsHandler({
+        type: 'jobs_updated',
+        jobs: {
+          job1: { progress: 0.4 },
+          job2: { status: 'running' },
+        }
+      });
+    });
+
+    expect(result.current.jobs.job1.progress).toBe(0.4);
+    expect(result.current.jobs.job1.status).toBe('running');
+    expect(result.current.jobs.job2.status).toBe('running');
+  });
+
   it('triggers onJobComplete when a job finishes', async () => {
     let wsHandler: (data: any) => void = () => {};
     (useWebSocket as any).mockImplementation((_url: string, handler: any) => {
@@ -26,22 +26,33 @@ export const useJobs = (onJobComplete?: () => void, onQueueUpdate?: () => void,
 
   const [testProgress, setTestProgress] = useState<Record<string, { progress: number; started_at?: number }>>({});
 
-  const handleUpdate = useCallback((data: any) => {
-    if (data.type === 'job_updated') {
-      const { job_id, updates } = data;
-      setJobs(prev => {
+  const mergeJobUpdates = useCallback((batch: Record<string, Partial<Job>>) => {
+    setJobs(prev => {
+      const next = { ...prev };
+      let missing = false;
+      for (const [job_id, updates] of Object.entries(batch)) {
         const oldJob = prev[job_id];
         if (!oldJob) {
           // If we don't have the job yet, we can't merge safely without the default fields.
           // We'll add it as a partial and trigger a refresh to get the full object.
-          refreshJobs();
+          missing = true;
           // But let's still store what we got so the UI can at least show the status/progress
-          return { ...prev, [job_id]: { id: job_id, ...updates } as Job };
+          next[job_id] = { id: job_id, ...updates } as Job;
+        } else {
+          next[job_id] = { ...oldJob, ...updates };
         }
+      }
+      if (missing) refreshJobs();
+      return next;
+    });
+  }, [refreshJobs]);
 
-        const newJob = { ...oldJob, ...updates };
-        return { ...prev, [job_id]: newJob };
-      });
+  const handleUpdate = useCallback((data: any) => {
+    if (data.type === 'jobs_updated') {
+      // One frame per flush, carrying job_id -> latest fields for every job that changed
+      mergeJobUpdates(data.jobs);
+    } else if (data.type === 'job_updated') {
+      mergeJobUpdates({ [data.job_id]: data.updates });
     } else if (data.type === 'queue_updated') {
         if (onQueueUpdate) onQueueUpdate();
     } else if (data.type === 'pause_updated') {
@@ -52,7 +63,7 @@ export const useJobs = (onJobComplete?: () => void, onQueueUpdate?: () => void,
     } else if (data.type === 'segments_updated') {
       if (onSegmentsUpdate) onSegmentsUpdate(data.chapter_id);
     }
-  }, [refreshJobs, onQueueUpdate, onPauseUpdate, onSegmentsUpdate]);
+  }, [mergeJobUpdates, onQueueUpdate, onPauseUpdate, onSegmentsUpdate]);
 
   const { connected } = useWebSocket('/ws', handleUpdate);
 
@@ -125,31 +125,37 @@ def test_queue_uniqueness():
     pid = create_project("Queue Uniqueness Test")
     cid = create_chapter(project_id=pid, title="Unique Chapter")
 
-    # 3. Add to queue first time
-    res1 = client.post("/api/processing_queue", data={
-        "project_id": pid,
-        "chapter_id": cid,
-        "split_part": 0,
-        "speaker_profile": "test_profile"
-    })
-    assert res1.status_code == 200
-
-    # 4. Attempt to add to queue second time
-    res2 = client.post("/api/processing_queue", data={
-        "project_id": pid,
-        "chapter_id": cid,
-        "split_part": 0,
-        "speaker_profile": "test_profile"
-    })
-
-    # Should succeed, but return the exact same queue_id instead of a new one
-    assert res2.status_code == 200
-    assert res1.json()["queue_id"] == res2.json()["queue_id"]
-
-    # 5. Verify the actual queue only has 1 physical row
-    q = get_queue()
-    chapter_entries = [i for i in q if i["chapter_id"] == cid]
-    assert len(chapter_entries) == 1
+    # Keep the worker from picking the job up (and finishing it) between the two requests
+    from app.jobs import set_paused
+    set_paused(True)
+    try:
+        # 3. Add to queue first time
+        res1 = client.post("/api/processing_queue", data={
+            "project_id": pid,
+            "chapter_id": cid,
+            "split_part": 0,
+            "speaker_profile": "test_profile"
+        })
+        assert res1.status_code == 200
+
+        # 4. Attempt to add to queue second time
+        res2 = client.post("/api/processing_queue", data={
+            "project_id": pid,
+            "chapter_id": cid,
+            "split_part": 0,
+            "speaker_profile": "test_profile"
+        })
+
+        # Should succeed, but return the exact same queue_id instead of a new one
+        assert res2.status_code == 200
+        assert res1.json()["queue_id"] == res2.json()["queue_id"]
+
+        # 5. Verify the actual queue only has 1 physical row
+        q = get_queue()
+        chapter_entries = [i for i in q if i["chapter_id"] == cid]
+        assert len(chapter_entries) == 1
+    finally:
+        set_paused(False)
 
 def test_clear_queue_preserves_running():
     """
@@ -218,3 +224,19 @@ def test_chapter_text_last_modified():
     assert chap3['text_content'] == "New text"
     assert chap3['text_last_modified'] > original_time # SHOULD have changed
 
+def test_media_files_stream_whole_and_ranged():
+    from app.config import XTTS_OUT_DIR
+    XTTS_OUT_DIR.mkdir(parents=True, exist_ok=True)
+    path = XTTS_OUT_DIR / "test_media_stream.wav"
+    data = bytes(range(256)) * 10000  # spans several chunks
+    path.write_bytes(data)
+    try:
+        response = client.get("/out/xtts/test_media_stream.wav")
+        assert response.status_code == 200
+        assert response.content == data
+
+        response = client.get("/out/xtts/test_media_stream.wav", headers={"Range": "bytes=1000000-1999999"})
+        assert response.status_code == 206
+        assert response.content == data[1000000:2000000]
+    finally:
+        path.unlink()
@@ -25,6 +25,7 @@ def test_create_project_with_cover():
 
     # Clean up cover
     cover_filename = project["cover_image_path"].replace("/out/covers/", "")
+    assert (COVER_DIR / cover_filename).read_bytes() == cover_content
     (COVER_DIR / cover_filename).unlink()
 
 def test_update_project_with_cover():
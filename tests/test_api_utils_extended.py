@@ -17,6 +17,17 @@ def test_read_preview(tmp_path):
     non_existent = tmp_path / "none.txt"
     assert read_preview(non_existent) == ""
 
+def test_read_preview_cached_until_file_changes(tmp_path):
+    p = tmp_path / "cached.txt"
+    p.write_text("first", encoding="utf-8")
+    assert read_preview(p) == "first"
+
+    with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+        assert read_preview(p) == "first"
+
+    p.write_text("second version", encoding="utf-8")
+    assert read_preview(p) == "second version"
+
 def test_output_exists(tmp_path, monkeypatch):
     monkeypatch.setattr(config, "XTTS_OUT_DIR", tmp_path / "xtts")
     monkeypatch.setattr(config, "AUDIOBOOK_DIR", tmp_path / "audio")
@@ -55,10 +66,13 @@ def test_is_react_dev_active():
     with patch("socket.socket") as mock_sock:
         mock_instance = mock_sock.return_value
         mock_instance.connect_ex.return_value = 0
-        assert is_react_dev_active() is True
+        assert is_react_dev_active(refresh=True) is True
 
+        # The answer is kept until a refresh is asked for
         mock_instance.connect_ex.return_value = 1
-        assert is_react_dev_active() is False
+        assert is_react_dev_active() is True
+        assert is_react_dev_active(refresh=True) is False
+        assert mock_instance.connect_ex.call_count == 2
 
 def test_process_and_split_file(tmp_path, monkeypatch):
     monkeypatch.setattr(config, "UPLOAD_DIR", tmp_path / "uploads")
@@ -109,3 +123,21 @@ def test_list_audiobooks(tmp_path, monkeypatch):
 
         proj_book = next(b for b in books if b["filename"] == "project.m4b")
         assert "/projects/p1/m4b/project.m4b" in proj_book["url"]
+
+def test_list_audiobooks_probes_each_file_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "AUDIOBOOK_DIR", tmp_path / "audiobook")
+    monkeypatch.setattr(config, "PROJECTS_DIR", tmp_path / "projects")
+    config.AUDIOBOOK_DIR.mkdir()
+    m4b = config.AUDIOBOOK_DIR / "cached.m4b"
+    m4b.write_text("v1")
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout='{"format": {"duration": "12.0", "tags": {"title": "Cached"}}}')
+        assert list_audiobooks()[0]["title"] == "Cached"
+        assert list_audiobooks()[0]["duration_seconds"] == 12.0
+        assert mock_run.call_count == 1
+
+        # A rebuilt file is probed again
+        m4b.write_text("version 2")
+        list_audiobooks()
+        assert mock_run.call_count == 2
@@ -66,3 +66,129 @@ def test_assemble_audiobook_ffmpeg_no_cover(tmp_path):
         # map 2:v refers to the 3rd input (cover), which should be missing
         assert "-map 2:v" not in cmd
         assert "disposition:v:0 attached_pic" not in cmd
+
+def test_get_audio_duration_cached_until_file_changes(tmp_path):
+    import os
+    from app.engines import get_audio_duration
+    audio = tmp_path / "dur.mp3"
+    audio.write_text("audio data")
+
+    with patch("app.engines._mutagen_file", None), patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout="12.5\n")
+        assert get_audio_duration(audio) == 12.5
+        assert get_audio_duration(audio) == 12.5
+        assert mock_run.call_count == 1
+
+        # A rewritten file is probed again
+        audio.write_text("longer audio data")
+        st = audio.stat()
+        os.utime(audio, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        mock_run.return_value = MagicMock(stdout="20.0\n")
+        assert get_audio_duration(audio) == 20.0
+        assert mock_run.call_count == 2
+
+    assert get_audio_duration(tmp_path / "missing.mp3") == 0.0
+
+def test_get_audio_durations_keeps_order(tmp_path):
+    from unittest.mock import patch
+    from app.engines import get_audio_durations
+    files = []
+    for i in range(4):
+        f = tmp_path / f"ch{i}.mp3"
+        f.write_bytes(b"x" * (i + 1))
+        files.append(f)
+
+    with patch("app.engines._probe_duration", side_effect=lambda p, t=None: float(p.stat().st_size)) as probe:
+        assert get_audio_durations(files + [tmp_path / "missing.mp3"]) == [1.0, 2.0, 3.0, 4.0, 0.0]
+        assert get_audio_durations(files) == [1.0, 2.0, 3.0, 4.0]
+        assert probe.call_count == 4
+
+def _write_wav(path, data: bytes, fmt_tag: int, bits: int, rate: int = 24000):
+    import struct
+    block = bits // 8
+    fmt = struct.pack("<HHIIHH", fmt_tag, 1, rate, rate * block, block, bits)
+    path.write_bytes(
+        b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + len(data)) + b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"data" + struct.pack("<I", len(data)) + data
+    )
+
+def _record_stitch_cmds(cmds, lists):
+    def run(cmd, on_output, cancel_check):
+        cmds.append(cmd)
+        if "-f concat" in cmd:
+            # The list file lives in a temp dir that is removed afterwards, so read it now
+            list_path = cmd.split("-f concat -safe 0 -i ")[1].split(" ")[0]
+            lists.append(Path(list_path).read_text())
+        return 0
+    return run
+
+def test_stitch_segments_uniform_inputs_use_concat_demuxer(tmp_path):
+    import struct
+    from app.engines import stitch_segments
+
+    segs = [tmp_path / f"seg_{i}.wav" for i in range(3)]
+    for seg in segs:
+        _write_wav(seg, struct.pack("<240h", *([8192] * 240)), fmt_tag=1, bits=16)
+    out = tmp_path / "chapter.wav"
+
+    cmds, lists = [], []
+    with patch("app.engines.run_cmd_stream", side_effect=_record_stitch_cmds(cmds, lists)):
+        assert stitch_segments(tmp_path, segs, out, MagicMock(), lambda: False) == 0
+    # A single ffmpeg run reading one list file, however many segments there are
+    assert len(cmds) == 1
+    assert "-f concat -safe 0" in cmds[0] and cmds[0].count(" -i ") == 1
+    assert lists == ["".join(f"file '{seg.absolute()}'\n" for seg in segs)]
+    # The temp dir holding the list is cleaned up
+    assert sorted(tmp_path.iterdir()) == sorted(segs)
+
+def test_stitch_segments_mixed_float_and_pcm16(tmp_path):
+    import shutil
+    import struct
+    import wave
+    from app.engines import stitch_segments, _wav_format
+
+    legacy = tmp_path / "seg_0.wav"   # rendered before the 16-bit switch: IEEE float
+    current = tmp_path / "seg_1.wav"  # 16-bit PCM
+    _write_wav(legacy, struct.pack("<2400f", *([0.25] * 2400)), fmt_tag=3, bits=32)
+    _write_wav(current, struct.pack("<2400h", *([8192] * 2400)), fmt_tag=1, bits=16)
+    assert _wav_format(legacy) == (3, 32) and _wav_format(current) == (1, 16)
+    out = tmp_path / "chapter.wav"
+
+    cmds, lists = [], []
+    with patch("app.engines.run_cmd_stream", side_effect=_record_stitch_cmds(cmds, lists)):
+        assert stitch_segments(tmp_path, [legacy, current], out, MagicMock(), lambda: False) == 0
+    # Only the float segment is converted; the demuxer then joins a uniform 16-bit list
+    assert len(cmds) == 2
+    assert f"-i {legacy.absolute()} -c:a pcm_s16le" in cmds[0]
+    assert "-f concat -safe 0" in cmds[1] and "-c:a pcm_s16le" in cmds[1]
+    entries = lists[0].splitlines()
+    assert len(entries) == 2 and str(legacy) not in entries[0]
+    assert entries[1] == f"file '{current.absolute()}'"
+    assert sorted(tmp_path.iterdir()) == [legacy, current]
+
+    if not shutil.which("ffmpeg"):
+        return
+    assert stitch_segments(tmp_path, [legacy, current], out, MagicMock(), lambda: False) == 0
+    with wave.open(str(out)) as w:
+        assert (w.getsampwidth(), w.getnframes()) == (2, 4800)
+        samples = struct.unpack(f"<{w.getnframes()}h", w.readframes(w.getnframes()))
+    # Both halves keep their level (0.25 full scale), so neither was misdecoded
+    assert abs(samples[100] - 8192) <= 1 and abs(samples[4000] - 8192) <= 1
+
+def test_xtts_generate_removes_partial_output_when_cancelled(tmp_path):
+    from app.engines import xtts_generate
+    activate = tmp_path / "activate"
+    activate.write_text("")
+    out_wav = tmp_path / "chapter.wav"
+
+    def cancelled_run(cmd, on_output, cancel_check):
+        # The script was terminated mid-chapter, before it could rename or remove its .part file
+        (tmp_path / "chapter.wav.part").write_bytes(b"partial")
+        return -15
+
+    with patch("app.engines.XTTS_ENV_ACTIVATE", activate), \
+         patch("app.engines.run_cmd_stream", side_effect=cancelled_run):
+        rc = xtts_generate("Hello there.", out_wav, True, MagicMock(), lambda: True, speaker_wav="v.wav")
+    assert rc == -15
+    assert not (tmp_path / "chapter.wav.part").exists()
@@ -65,3 +65,11 @@ def test_job_cancellation_timing():
     assert item['status'] == 'cancelled'
     assert item['started_at'] is not None
     assert item['completed_at'] is not None
+
+def test_db_uses_wal_journal():
+    """Per-job status writes go through a WAL-mode database."""
+    from app.db import get_connection
+    init_db()
+    with get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
@@ -1,10 +1,12 @@
 from app.jobs import (
     enqueue, requeue, cancel, clear_job_queue, 
     paused, toggle_pause, set_paused, _estimate_seconds, format_seconds,
-    _output_exists, cleanup_and_reconcile, get_speaker_wavs, get_speaker_settings
+    _output_exists, cleanup_and_reconcile, get_speaker_wavs, get_speaker_settings,
+    get_jobs, update_job
 )
 from app.models import Job
 import time
+import pytest
 from unittest.mock import patch, MagicMock
 
 def test_pause_states():
@@ -28,6 +30,25 @@ def test_output_exists():
     with patch('pathlib.Path.exists', return_value=True), patch('pathlib.Path.stat'):
         assert _output_exists("xtts", "c1.txt") is True
 
+def test_xtts_paths():
+    from pathlib import Path
+    from app.jobs.reconcile import _xtts_paths
+    wav, mp3 = _xtts_paths(Path("/out"), "part.one_0.txt")
+    assert wav == Path("/out/part.one_0.wav")
+    assert mp3 == Path("/out/part.one_0.mp3")
+
+def test_log_tail_keeps_last_chars():
+    from app.jobs.core import LogTail
+    tail = LogTail(["header\n"], limit=50)
+    lines = ["header\n"]
+    for i in range(200):
+        line = f"line {i}\n"
+        tail.append(line)
+        lines.append(line)
+        assert tail.text() == "".join(lines)[-50:]
+    # Old lines are dropped rather than kept around
+    assert len(list(tail)) < 10
+
 def test_cleanup_and_reconcile():
     with patch('app.jobs.get_jobs', return_value={}), patch('app.state.delete_jobs'):
         res = cleanup_and_reconcile()
@@ -42,3 +63,73 @@ def test_speaker_helpers():
 
     with patch('app.jobs.get_settings', return_value={"default_speaker_profile": "v2"}):
         get_speaker_settings("default")
+
+def test_output_exists_cached_index(tmp_path):
+    import os
+    from app.jobs import reconcile
+    out = tmp_path / "xtts"
+    out.mkdir()
+    (out / "c1.wav").write_text("wav")
+    # Age the directory so its listing is eligible for caching
+    os.utime(out, (time.time() - 60, time.time() - 60))
+
+    with patch.object(reconcile, "XTTS_OUT_DIR", out):
+        assert _output_exists("xtts", "c1.txt", make_mp3=False, cached=True) is True
+        with patch("app.jobs.reconcile.os.scandir", side_effect=AssertionError("listing should be cached")):
+            assert _output_exists("xtts", "c1.txt", make_mp3=False, cached=True) is True
+
+        # Adding/removing entries bumps the directory mtime and invalidates the listing;
+        # a just-modified directory isn't re-listed, its paths are stat'ed instead
+        (out / "c1.wav").unlink()
+        with patch("app.jobs.reconcile.os.scandir", side_effect=AssertionError("fresh directory listed")):
+            assert _output_exists("xtts", "c1.txt", make_mp3=False, cached=True) is False
+
+def test_dir_index_is_bounded(tmp_path):
+    import os
+    from app.jobs import reconcile
+    dirs = []
+    for i in range(5):
+        d = tmp_path / f"d{i}"
+        d.mkdir()
+        os.utime(d, (time.time() - 60, time.time() - 60))
+        dirs.append(d)
+
+    with patch.object(reconcile, "_DIR_INDEX", {}), patch.object(reconcile, "_DIR_INDEX_MAX", 3):
+        for d in dirs:
+            assert reconcile._dir_entries(d) == frozenset()
+        # Oldest listings are evicted first
+        assert list(reconcile._DIR_INDEX) == [str(d) for d in dirs[2:]]
+
+class _StopWorker(Exception):
+    pass
+
+class _OneShotQueue:
+    """Hands worker_loop the given ids, then stops it."""
+    def __init__(self, *items):
+        self.items = list(items)
+
+    def get(self):
+        if not self.items:
+            raise _StopWorker()
+        return self.items.pop(0)
+
+def test_cancelled_job_skipped_by_worker_and_flag_reaped():
+    from app.jobs.core import cancel_flags, CancelFlag
+    from app.jobs.worker import worker_loop
+    from app.state import put_job
+    jid = "cf_job"
+    put_job(Job(id=jid, engine="xtts", chapter_file="cf.txt", status="queued", created_at=time.time()))
+    cancel_flags[jid] = CancelFlag()
+    cancel(jid)
+    # Unknown jobs are ignored
+    cancel("missing_job")
+
+    # Cancelled from the editor while still queued: the flag stays set until the worker sees it
+    update_job(jid, status="cancelled")
+    assert cancel_flags[jid].cancelled is True
+
+    with patch("app.jobs.worker.update_job") as worker_update, pytest.raises(_StopWorker):
+        worker_loop(_OneShotQueue(jid))
+    worker_update.assert_not_called()
+    assert get_jobs()[jid].status == "cancelled"
+    assert jid not in cancel_flags
@@ -40,10 +40,11 @@ def test_import_legacy_filesystem_data_success(tmp_path):
         assert "Successfully imported 2 chapters" in res["message"]
         assert res["project_id"] == "proj_123"
 
-        # Verify database calls
-        assert mock_cursor.execute.call_count == 2
-        # Check calls (status is at index 5 in the tuple)
-        calls = mock_cursor.execute.call_args_list
-        statuses = [call[0][1][5] for call in calls]
+        # Verify database calls: one bulk insert carrying both rows
+        assert mock_cursor.executemany.call_count == 1
+        rows = mock_cursor.executemany.call_args[0][1]
+        assert len(rows) == 2
+        # Check rows (status is at index 5 in the tuple)
+        statuses = [row[5] for row in rows]
         assert "done" in statuses
         assert "unprocessed" in statuses
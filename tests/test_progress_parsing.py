@@ -15,6 +15,8 @@ def test_progress_simulation():
 
     start = time.time()
     logs = []
+    # Job uses __slots__, so broadcast markers are tracked outside it (as in worker_loop)
+    broadcast = {"time": 0, "p": 0.0}
 
     # Simulate on_output
     def simulate_line(line, elapsed_offset=0):
@@ -31,13 +33,13 @@ def test_progress_simulation():
             current_p = getattr(j, 'progress', 0.0)
             prog = min(0.98, max(current_p, elapsed / max(1, eta)))
 
-            last_b = getattr(j, '_last_broadcast_time', 0)
-            last_p = getattr(j, '_last_broadcast_p', 0.0)
+            last_b = broadcast["time"]
+            last_p = broadcast["p"]
             if (prog - last_p >= 0.01) or (now - last_b >= 30.0):
                 prog = round(prog, 2)
                 j.progress = prog
-                j._last_broadcast_time = now
-                j._last_broadcast_p = prog
+                broadcast["time"] = now
+                broadcast["p"] = prog
                 return {"progress": prog}
             return None
 
@@ -63,7 +65,7 @@ def test_progress_simulation():
             logs.append(line)
             new_log = "".join(logs)[-20000:]
 
-        broadcast_p = getattr(j, '_last_broadcast_p', 0.0)
+        broadcast_p = broadcast["p"]
 
         if new_progress is None:
             current_p = j.progress
@@ -75,7 +77,7 @@ def test_progress_simulation():
         args = {}
         if include_progress:
             j.progress = new_progress
-            j._last_broadcast_p = new_progress
+            broadcast["p"] = new_progress
             args['progress'] = new_progress
 
         if new_log is not None:
@@ -171,6 +171,22 @@ def test_rename_variant_profile(clean_voices):
     assert new_meta["variant_name"] == new_variant_label
     assert new_meta["speaker_id"] == speaker_id
 
+def test_list_profiles_cached_until_profile_changes(clean_voices):
+    profile_dir = clean_voices / "Cached"
+    profile_dir.mkdir()
+    (profile_dir / "a.wav").write_text("audio")
+    assert client.get("/api/speaker-profiles").json()[0]["wav_count"] == 1
+
+    # Unchanged folder: served without re-reading the profile settings
+    with patch("app.api.routers.voices.get_speaker_settings", side_effect=AssertionError("re-read")):
+        assert client.get("/api/speaker-profiles").json()[0]["wav_count"] == 1
+
+    (profile_dir / "b.wav").write_text("audio")
+    assert client.get("/api/speaker-profiles").json()[0]["wav_count"] == 2
+
+    client.post("/api/speaker-profiles/Cached/speed", data={"speed": 1.3})
+    assert client.get("/api/speaker-profiles").json()[0]["speed"] == 1.3
+
 def test_get_speaker_settings(clean_voices):
     from app.jobs import get_speaker_settings
     from app.state import update_settings
@@ -100,7 +100,7 @@ def test_requeue_clean_slate():
     )
     put_job(job)
 
-    with patch("app.jobs.job_queue.put"):
+    with patch("app.jobs.job_queue"):
         requeue("test_requeue")
 
     state = load_state()
@@ -112,3 +112,184 @@ def test_requeue_clean_slate():
     assert j["finished_at"] is None
     assert j["error"] is None
     assert j["warning_count"] == 0
+
+
+def test_performance_metrics_flushed_on_interval():
+    from app import state as state_mod
+    state_mod.flush_performance_metrics()
+    state_mod.update_performance_metrics(xtts_cps=42.0)
+
+    # Visible immediately, but not written until the interval elapses or a flush
+    assert state_mod.get_performance_metrics()["xtts_cps"] == 42.0
+    assert load_state()["performance_metrics"].get("xtts_cps") != 42.0
+
+    state_mod.flush_performance_metrics()
+    assert load_state()["performance_metrics"]["xtts_cps"] == 42.0
+
+
+def test_state_cached_between_writes_and_reloaded_on_external_change():
+    from app import state as state_mod
+    job = Job(id="test_cache", engine="xtts", chapter_file="c1.txt", status="running", created_at=time.time())
+    put_job(job)
+
+    # Our own writes keep the cache valid, so updates don't re-read the file
+    with patch.object(Path, "read_bytes", side_effect=AssertionError("state re-read")):
+        update_job("test_cache", progress=0.5)
+        assert load_state()["jobs"]["test_cache"]["progress"] == 0.5
+
+    # Returned state is a copy; mutating it doesn't leak into the cache
+    load_state()["jobs"]["test_cache"]["progress"] = 0.9
+    assert load_state()["jobs"]["test_cache"]["progress"] == 0.5
+
+    # An external rewrite is picked up
+    state_mod.flush_state()
+    raw = json.loads(state_mod.STATE_FILE.read_text())
+    raw["jobs"]["test_cache"]["progress"] = 0.75
+    state_mod.STATE_FILE.write_text(json.dumps(raw, indent=2))
+    assert load_state()["jobs"]["test_cache"]["progress"] == 0.75
+
+
+def test_state_writes_are_coalesced():
+    from app import state as state_mod
+    put_job(Job(id="test_coalesce", engine="xtts", chapter_file="c1.txt", status="running", created_at=time.time()))
+    state_mod.flush_state()
+    time.sleep(2 * state_mod.STATE_WRITE_DELAY)  # let any in-flight writer cycle finish
+
+    with patch.object(state_mod, "STATE_WRITE_DELAY", 5.0), \
+         patch.object(state_mod, "_atomic_write_bytes", wraps=state_mod._atomic_write_bytes) as write, \
+         patch.object(state_mod, "_append_log_bytes", wraps=state_mod._append_log_bytes) as append:
+        for p in (0.1, 0.2, 0.3, 0.4):
+            update_job("test_coalesce", progress=p)
+        assert append.call_count == 0
+        assert load_state()["jobs"]["test_coalesce"]["progress"] == 0.4
+
+        state_mod.flush_state()
+        # Job updates are appended to the log in one write; state.json itself isn't rewritten
+        assert append.call_count == 1
+        assert write.call_count == 0
+
+    state_mod._STATE_CACHE = None
+    assert load_state()["jobs"]["test_coalesce"]["progress"] == 0.4
+
+
+def test_state_update_log_replayed_and_compacted(tmp_path):
+    from app import state as state_mod
+    with patch.object(state_mod, "STATE_FILE", tmp_path / "state.json"):
+        put_job(Job(id="logged", engine="xtts", chapter_file="c1.txt", status="running", created_at=time.time()))
+        state_mod.flush_state()
+        update_job("logged", progress=0.3, log="line 1")
+        update_job("logged", progress=0.6)
+        state_mod.flush_state()
+
+        records = [json.loads(line) for line in (tmp_path / "state.log").read_text().splitlines()]
+        assert records[0]["op"] == "base"
+        assert records[1:] == [{"op": "update_job", "id": "logged", "fields": {"progress": 0.6, "log": "line 1"}}]
+        assert json.loads((tmp_path / "state.json").read_text())["jobs"]["logged"]["progress"] == 0.0
+
+        # A fresh load replays the log; a torn trailing record is ignored
+        with open(tmp_path / "state.log", "a") as f:
+            f.write('{"op":"update_job","id":"logged","fi')
+        state_mod._STATE_CACHE = None
+        job = load_state()["jobs"]["logged"]
+        assert (job["progress"], job["log"]) == (0.6, "line 1")
+
+        # Any other mutation folds everything back into state.json and starts a new log
+        put_job(Job(id="other", engine="xtts", chapter_file="c2.txt", status="queued", created_at=time.time()))
+        state_mod.flush_state()
+        assert json.loads((tmp_path / "state.json").read_text())["jobs"]["logged"]["progress"] == 0.6
+        assert len((tmp_path / "state.log").read_text().splitlines()) == 1
+
+        # A log that doesn't match state.json (e.g. the file was replaced) is not replayed
+        update_job("logged", progress=0.9)
+        state_mod.flush_state()
+        raw = json.loads((tmp_path / "state.json").read_text())
+        (tmp_path / "state.json").write_text(json.dumps(raw))
+        state_mod._STATE_CACHE = None
+        assert load_state()["jobs"]["logged"]["progress"] == 0.6
+
+
+def test_state_lock_shared_reads_exclusive_writes():
+    import threading
+    from app.state import _StateLock
+    lock = _StateLock()
+
+    # Two readers can hold the lock at the same time
+    both_in = threading.Barrier(2, timeout=2)
+    def reader():
+        with lock.read():
+            both_in.wait()
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads: t.start()
+    for t in threads: t.join(2)
+    assert not both_in.broken
+
+    # The write side is re-entrant and its holder may read
+    with lock:
+        with lock:
+            with lock.read():
+                pass
+        # Other threads can't read while it is held
+        got_read = threading.Event()
+        def blocked_reader():
+            with lock.read():
+                got_read.set()
+        t = threading.Thread(target=blocked_reader)
+        t.start()
+        assert not got_read.wait(0.1)
+    assert got_read.wait(2)
+    t.join(2)
+
+def test_db_sync_runs_outside_state_lock():
+    import threading
+    from app.state import get_settings
+    clear_all_jobs()
+    put_job(Job(id="sync_job", engine="xtts", chapter_file="c.txt", status="queued", created_at=0))
+
+    seen = []
+    def fake_update_queue_item(job_id, status, **kwargs):
+        # Another thread must be able to read state while the DB sync runs
+        t = threading.Thread(target=get_settings)
+        t.start()
+        t.join(1)
+        seen.append((job_id, status, t.is_alive()))
+
+    with patch("app.state.update_queue_item", side_effect=fake_update_queue_item):
+        update_job("sync_job", status="running")
+    assert seen == [("sync_job", "running", False)]
+    clear_all_jobs()
+
+def test_db_syncs_wait_their_turn_outside_state_lock():
+    import threading
+    from app.state import get_settings
+    clear_all_jobs()
+    for jid in ("sync_a", "sync_b"):
+        put_job(Job(id=jid, engine="xtts", chapter_file=f"{jid}.txt", status="queued", created_at=0))
+
+    release_a = threading.Event()
+    order = []
+    def fake_update_queue_item(job_id, status, **kwargs):
+        if job_id == "sync_a":
+            release_a.wait(2)
+        order.append(job_id)
+
+    with patch("app.state.update_queue_item", side_effect=fake_update_queue_item):
+        a = threading.Thread(target=update_job, args=("sync_a",), kwargs={"status": "running"})
+        a.start()
+        time.sleep(0.05)
+        b = threading.Thread(target=update_job, args=("sync_b",), kwargs={"status": "running"})
+        b.start()
+        time.sleep(0.05)
+
+        # b's state change is in, and it waits for a's sync without holding the state lock
+        reader = threading.Thread(target=get_settings)
+        reader.start()
+        reader.join(1)
+        assert not reader.is_alive()
+        assert load_state()["jobs"]["sync_b"]["status"] == "running"
+        assert order == []
+
+        release_a.set()
+        a.join(2)
+        b.join(2)
+    assert order == ["sync_a", "sync_b"]
+    clear_all_jobs()
@@ -48,3 +48,18 @@ def test_safe_filename():
 
 def test_split_sentences():
     assert len(list(split_sentences("One. Two! Three?"))) == 3
+
+def test_split_sentences_unterminated_tail():
+    # A long run with no terminator is the remainder, found without rescanning it per character
+    tail = "word " * 40000
+    assert list(split_sentences("One. " + tail)) == [("One.", 0, 4), (tail.strip(), 5, 5 + len(tail.strip()))]
+
+def test_clean_line_fast_path_matches_full_pipeline():
+    from app.textops import _is_tts_clean
+    assert _is_tts_clean("It's a quiet night in the village.")
+    assert sanitize_for_xtts("It's a quiet night in the village.") == "It's a quiet night in the village."
+
+    # Anything a pass would rewrite, or a second sentence, takes the full path
+    for text in ["Wait. What now?", "He said \"no\".", "The U.S.A. is big.", "Half is 1/2.",
+                 "Hello  there.", "...and then.", "Really??", "Café time."]:
+        assert not _is_tts_clean(text)
@@ -26,7 +26,9 @@ def test_worker_progress_update():
     from app.state import put_job
     put_job(j)
 
-    # 2. Add to internal queue
+    # 2. Add to internal queue (paused, so the background worker doesn't update the job mid-test)
+    from app.jobs import set_paused
+    set_paused(True)
     job_queue.put(jid)
 
     # Since we can't easily run the real worker_loop because it's already running in background
@@ -43,9 +45,12 @@ def test_worker_progress_update():
     # Simulate what on_output does
     update_job(jid, progress=0.25, log="Test log")
 
-    assert len(updates_received) > 0
-    assert updates_received[0]["progress"] == 0.25
-    assert "log" in updates_received[0]
+    try:
+        assert len(updates_received) > 0
+        assert updates_received[0]["progress"] == 0.25
+        assert "log" in updates_received[0]
+    finally:
+        set_paused(False)
 
 def test_prediction_logic():
     # Test the calculation in jobs.py if we can
@@ -54,3 +59,94 @@ def test_prediction_logic():
     # Test expectation for _estimate_seconds (minimum is 5)
     assert _estimate_seconds(20, 10) == 5
     assert _estimate_seconds(200, 10) == 20
+
+def test_build_header_format():
+    from app.jobs.worker import _build_header
+    header = _build_header("c1.txt", "2024-01-01 00:00:00", "XTTS", ["Character Count: 1,200"], 65)
+    assert header == (
+        "Job Started: c1.txt\n"
+        "Started At:  2024-01-01 00:00:00\n"
+        "Engine: XTTS\n"
+        "Character Count: 1,200\n"
+        "Predicted Duration: 1m 5s\n"
+        + "-" * 40 + "\n\n"
+    )
+
+def test_job_update_buffer_coalesces_and_stops_after_terminal():
+    from app.jobs.core import JobUpdateBuffer
+    from app.state import put_job
+
+    jid = "buffered_job"
+    put_job(Job(id=jid, engine="xtts", chapter_file="b.txt", status="running", created_at=time.time()))
+
+    buf = JobUpdateBuffer()  # not started or registered: apply manually via flush()
+    buf.open(jid)
+    buf.push(jid, progress=0.2, log="a")
+    buf.push(jid, progress=0.3)
+    buf.push(jid, log="ab")
+    buf.flush()
+    j = get_jobs()[jid]
+    assert j.progress == 0.3
+    assert j.log == "ab"
+
+    # A terminal update closes the channel; updates queued before it are dropped
+    buf.push(jid, log="stale")
+    update_job(jid, status="done", progress=1.0, log="final")
+    buf._on_job_updated(jid, {"status": "done"})
+    assert jid in buf._closed
+    buf.flush()
+    remaining = get_jobs().get(jid)
+    assert remaining is None or remaining.log == "final"
+    # ...and once they are drained the closed id is forgotten
+    assert jid not in buf._closed
+
+def test_job_update_buffer_skips_job_finished_before_listener_ran():
+    from app.jobs.core import JobUpdateBuffer
+    from app.state import put_job
+
+    jid = "buffered_race_job"
+    put_job(Job(id=jid, engine="xtts", chapter_file="r.txt", status="running", created_at=time.time()))
+
+    buf = JobUpdateBuffer()
+    buf.open(jid)
+    buf.push(jid, progress=0.4, log="stale")
+    # The job finishes but its listener hasn't marked the id closed yet
+    update_job(jid, status="done", progress=1.0, log="final")
+    assert jid not in buf._closed
+    buf.flush()
+    j = get_jobs()[jid]
+    assert j.status == "done"
+    assert j.progress == 1.0
+    assert j.log == "final"
+
+def test_job_listeners_run_outside_state_lock():
+    from app.jobs.core import JobUpdateBuffer
+    from app.state import put_job, add_job_listener, get_settings
+
+    jid = "listener_lock_job"
+    put_job(Job(id=jid, engine="xtts", chapter_file="l.txt", status="running", created_at=time.time()))
+
+    seen = []
+    def listener(job_id, updates):
+        if job_id != jid:
+            return
+        # Another thread can read state while listeners run
+        t = threading.Thread(target=get_settings)
+        t.start()
+        t.join(1)
+        seen.append(t.is_alive())
+        if updates.get("status") == "done":
+            # The channel hasn't been closed yet, but the stored status stops a late update
+            buf.push(jid, log="stale")
+            buf.flush()
+
+    add_job_listener(listener)
+    buf = JobUpdateBuffer()  # not registered as a listener, so its channel stays open
+    buf.open(jid)
+    # Buffered updates are applied without the state lock held, so listeners run outside it too
+    buf.push(jid, progress=0.5)
+    buf.flush()
+    update_job(jid, status="done", progress=1.0, log="final")
+    assert seen == [False, False]
+    remaining = get_jobs().get(jid)
+    assert remaining is None or remaining.log == "final"
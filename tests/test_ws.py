@@ -0,0 +1,109 @@
+import asyncio
+import json
+from app.api.ws import ConnectionManager, _encode_message
+
+
+class FakeSocket:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("gone")
+        self.received.append(json.loads(payload))
+
+    async def close(self):
+        self.closed = True
+
+
+def test_broadcast_isolates_slow_clients_and_drops_failed_ones(monkeypatch):
+    monkeypatch.setattr("app.api.ws.SEND_TIMEOUT", 0.3)
+    monkeypatch.setattr("app.api.ws.CLIENT_QUEUE_SIZE", 2)
+    manager = ConnectionManager()
+    fast = FakeSocket()
+    slow, broken, stalled = FakeSocket(delay=0.1), FakeSocket(fail=True), FakeSocket(delay=10)
+
+    async def run():
+        for ws in (fast, slow, broken, stalled):
+            await manager.connect(ws)
+        # Enqueuing returns immediately; each client's writer drains its own queue
+        for i in range(4):
+            manager._send_to_all(_encode_message({"n": i}))
+            await asyncio.sleep(0.01)
+        assert fast.received == [{"n": i} for i in range(4)]
+        await asyncio.sleep(0.5)
+        manager.disconnect(fast)
+        manager.disconnect(slow)
+
+    asyncio.run(run())
+    # Frames are never dropped: the slow client overflowed its queue and was closed instead,
+    # so it reconnects and resyncs
+    assert slow.closed
+    assert slow.received == [{"n": i} for i in range(len(slow.received))]
+    assert broken.closed and stalled.closed
+    assert not fast.closed
+    assert manager.active_connections == {}
+
+
+def test_job_updates_coalesced_per_job(monkeypatch):
+    from app import web
+    from app.api import ws
+    sent = []
+
+    def fake_send_to_all(payload):
+        sent.append(json.loads(payload))
+
+    monkeypatch.setattr(ws.manager, "_send_to_all", fake_send_to_all)
+    monkeypatch.setattr(ws, "JOB_UPDATE_INTERVAL", 0.05)
+    # Start from a clean batch; other tests' jobs may have left updates for a loop that's gone
+    monkeypatch.setattr(ws, "_pending_job_updates", {})
+    monkeypatch.setattr(ws, "_flush_scheduled", False)
+
+    async def run():
+        monkeypatch.setattr(web, "_main_loop", [asyncio.get_running_loop()])
+        for p in (0.1, 0.2, 0.3):
+            ws.broadcast_job_updated("a", {"progress": p})
+        ws.broadcast_job_updated("a", {"status": "running"})
+        ws.broadcast_job_updated("b", {"progress": 0.5})
+        await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+    # One frame for the whole flush, with each job's updates merged
+    frames = [m for m in sent if {"a", "b"} & m["jobs"].keys()]
+    assert len(frames) == 1 and frames[0]["type"] == "jobs_updated"
+    assert frames[0]["jobs"]["a"] == {"progress": 0.3, "status": "running"}
+    assert frames[0]["jobs"]["b"] == {"progress": 0.5}
+
+
+def test_job_update_burst_larger_than_client_queue_is_not_lost(monkeypatch):
+    from app import web
+    from app.api import ws
+    manager = ConnectionManager()
+    client = FakeSocket()
+    monkeypatch.setattr(ws, "manager", manager)
+    monkeypatch.setattr(ws, "JOB_UPDATE_INTERVAL", 0.05)
+    monkeypatch.setattr(ws, "_pending_job_updates", {})
+    monkeypatch.setattr(ws, "_flush_scheduled", False)
+    job_ids = [f"burst_{i}" for i in range(ws.CLIENT_QUEUE_SIZE + 50)]
+
+    async def run():
+        monkeypatch.setattr(web, "_main_loop", [asyncio.get_running_loop()])
+        await manager.connect(client)
+        for jid in job_ids:
+            ws.broadcast_job_updated(jid, {"status": "queued"})
+        await asyncio.sleep(0.3)
+        manager.disconnect(client)
+
+    asyncio.run(run())
+    assert not client.closed
+    delivered = {}
+    for frame in client.received:
+        delivered.update((k, v) for k, v in frame["jobs"].items() if k.startswith("burst_"))
+    assert delivered == {jid: {"status": "queued"} for jid in job_ids}